@@ -122,6 +122,20 @@ class TestJsonViewer:
         assert content == "" or content.isspace()
         assert json_viewer.get_json_data() is None
 
+    def test_formatted_state_tracking(self, json_viewer):
+        """Test formatted flag follows content mutations."""
+        assert json_viewer.is_formatted() is False
+
+        json_viewer.display_json({"test": "data"})
+        assert json_viewer.is_formatted() is True
+
+        json_viewer.display_plain_text('{"test": "data"}')
+        assert json_viewer.is_formatted() is False
+
+        json_viewer.set_text('{\n  "test": "data"\n}', formatted=True)
+        assert json_viewer.is_formatted() is True
+        assert json_viewer.get_content() == '{\n  "test": "data"\n}'
+
 
 class TestRequestForm:
     """Test cases for RequestForm component."""
@@ -4,16 +4,20 @@ Tests logger, error handler, startup validator, and other utilities.
 """
 import pytest
 import tempfile
+import time
 import os
 import logging
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import tkinter as tk
 
-from utils.logger import initialize_logging, LogLevel, get_logger
+from utils.logger import initialize_logging, LogLevel, get_logger, _SizeTrackingRotatingFileHandler
 from utils.error_handler import ErrorHandler, ErrorCategory, ErrorSeverity, ErrorInfo
+from utils import startup_validator
 from utils.startup_validator import validate_startup, ValidationResult
+from utils import validators
 from utils.validators import validate_url, validate_port, validate_timeout, validate_json
+from utils.validators import JSONValidator, URLValidator, validate_all
 
 
 class TestLogger:
@@ -85,6 +89,26 @@ class TestLogger:
         logger2 = get_logger("test")
         
         assert logger1 is logger2
+    
+    def test_rotation_respects_max_bytes_with_non_ascii(self):
+        """Test that rotated files stay within maxBytes for multi-byte text."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "rotate.log"
+            handler = _SizeTrackingRotatingFileHandler(
+                log_file, maxBytes=2000, backupCount=20, encoding="utf-8", delay=True
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            
+            for i in range(200):
+                record = logging.LogRecord("test", logging.INFO, __file__, 0,
+                                           "entrée %d: éééééééééé", (i,), None)
+                handler.handle(record)
+            handler.close()
+            
+            log_files = list(Path(temp_dir).glob("rotate.log*"))
+            assert len(log_files) > 1
+            for path in log_files:
+                assert path.stat().st_size <= 2000, path.name
 
 
 class TestErrorHandler:
@@ -256,6 +280,42 @@ class TestErrorHandler:
             assert has_keyword, f"No suggestion contains '{expected_keyword}' for error: {error}"
 
 
+class TestErrorDialogCoalescing:
+    """Test cases for coalescing queued error dialogs without a display."""
+    
+    @pytest.fixture
+    def error_handler(self):
+        """Create error handler with a mock parent window and recorded dialogs."""
+        handler = ErrorHandler(Mock())
+        handler._render_detailed_error_dialog = Mock(
+            side_effect=lambda info: setattr(handler, '_detail_error_info', info)
+        )
+        return handler
+    
+    def test_drain_shows_each_error_category(self, error_handler):
+        """Test that errors of two categories queued together are both shown."""
+        for category, message in ((ErrorCategory.NETWORK, "Connection refused"),
+                                  (ErrorCategory.NETWORK, "Connection reset"),
+                                  (ErrorCategory.SERVICE, "Service unavailable")):
+            error_handler._show_error_dialog(ErrorInfo(category, ErrorSeverity.ERROR, message))
+        
+        error_handler._drain_dialogs()
+        
+        render = error_handler._render_detailed_error_dialog
+        assert render.call_count == 1
+        first = render.call_args[0][0]
+        assert first.category == ErrorCategory.NETWORK
+        assert "1 similar error(s)" in first.user_message
+        
+        # The next category is shown once the user closes the dialog
+        error_handler._hide_detailed_error_dialog()
+        assert render.call_count == 2
+        assert render.call_args[0][0].category == ErrorCategory.SERVICE
+        
+        error_handler._hide_detailed_error_dialog()
+        assert render.call_count == 2
+
+
 class TestStartupValidator:
     """Test cases for startup validator."""
     
@@ -289,6 +349,66 @@ class TestStartupValidator:
             assert success is False
             assert len(summary) > 0
             assert any("python" in item.lower() for item in summary)
+    
+    @pytest.fixture
+    def cached_validator(self, tmp_path, monkeypatch):
+        """Create a validator whose result cache lives in a temporary directory."""
+        monkeypatch.setattr(startup_validator, "_CACHE_PATH", tmp_path / "validation.json")
+        validator = startup_validator.StartupValidator()
+        validator.validation_results = [
+            ValidationResult(True, "Python version OK"),
+            ValidationResult(False, "Missing required modules"),
+        ]
+        return validator
+    
+    def test_validation_cache_round_trip(self, cached_validator):
+        """Test that passing cacheable results are reloaded for the same key."""
+        cache_key = ["python", "linux"]
+        cached_validator._save_cached_results(cache_key, ["Python Version", "Required Modules"])
+        
+        cached = cached_validator._load_cached_results(cache_key)
+        assert list(cached) == ["Python Version"]
+        result, saved_at = cached["Python Version"]
+        assert str(result) == "✓ Python version OK"
+        assert saved_at <= time.time()
+    
+    def test_validation_cache_key_mismatch(self, cached_validator):
+        """Test that results cached for another environment are ignored."""
+        cached_validator._save_cached_results(["python", "linux"], ["Python Version"])
+        
+        assert cached_validator._load_cached_results(["python", "darwin"]) == {}
+    
+    def test_validation_cache_expires(self, cached_validator):
+        """Test that results older than the cache TTL are ignored."""
+        cache_key = ["python", "linux"]
+        cached_validator._save_cached_results(cache_key, ["Python Version"])
+        
+        expired = time.time() + startup_validator._CACHE_TTL_SECONDS + 1
+        with patch.object(startup_validator.time, "time", return_value=expired):
+            assert cached_validator._load_cached_results(cache_key) == {}
+    
+    def test_validation_cache_expires_while_a_check_keeps_failing(self, cached_validator):
+        """Test that rewriting the cache for a failing check does not extend the TTL."""
+        python_check = Mock(return_value=ValidationResult(True, "Python version OK"))
+        cached_validator.validate_python_version = python_check
+        cached_validator.validate_required_modules = lambda: ValidationResult(False, "Missing modules")
+        for method_name in ("validate_tkinter_availability", "validate_system_resources",
+                            "validate_configuration_files", "validate_network_connectivity",
+                            "validate_permissions"):
+            setattr(cached_validator, method_name, lambda: ValidationResult(True, "OK"))
+        
+        start = time.time()
+        ttl = startup_validator._CACHE_TTL_SECONDS
+        for offset in (0, ttl / 2, ttl + 1):
+            now = start + offset
+            with patch.object(startup_validator.time, "time", return_value=now):
+                cached_validator.run_all_validations(force=False)
+                cached_validator._completed = False
+            # Move the file's mtime along with the simulated clock
+            os.utime(startup_validator._CACHE_PATH, (now, now))
+        
+        # Computed on the first run, replayed on the second, expired on the third
+        assert python_check.call_count == 2
 
 
 class TestValidators:
@@ -363,6 +483,67 @@ class TestValidators:
         
         for json_str in invalid_json_strings:
             assert validate_json(json_str) is False, f"JSON should be invalid: {json_str}"
+    
+    def test_json_parse_returns_value(self):
+        """Test that JSONValidator.parse returns the parsed value."""
+        result, parsed = JSONValidator.parse('  {"key": [1, 2, null]}  ')
+        assert result.is_valid is True
+        assert parsed == {"key": [1, 2, None]}
+        
+        result, parsed = JSONValidator.parse("")
+        assert result.is_valid is True
+        assert parsed is None
+    
+    def test_json_parse_invalid(self):
+        """Test that JSONValidator.parse reports invalid JSON without a value."""
+        result, parsed = JSONValidator.parse('{"key" "value"}')
+        assert result.is_valid is False
+        assert "Invalid JSON" in result.message
+        assert result.suggestions == ("Check for missing colons after property names",)
+        assert parsed is None
+        
+        result, parsed = JSONValidator.parse("not json")
+        assert result.is_valid is False
+        assert parsed is None
+    
+    def test_validate_json_cache(self):
+        """Test that short JSON results are cached and large payloads bypass the cache."""
+        validators._validate_json_cached.cache_clear()
+        
+        assert JSONValidator.validate_json('{"a": 1}').is_valid is True
+        assert JSONValidator.validate_json('{"a": 1}').is_valid is True
+        assert validators._validate_json_cached.cache_info().hits == 1
+        
+        large = '{"a": "' + "x" * validators._JSON_CACHE_MAX_LENGTH + '"}'
+        assert JSONValidator.validate_json(large).is_valid is True
+        assert JSONValidator.validate_json(large[:-1]).is_valid is False
+        assert validators._validate_json_cached.cache_info().currsize == 1
+    
+    def test_validate_url_cache(self):
+        """Test that URL results are cached per URL and scheme requirement."""
+        validators._validate_url_cached.cache_clear()
+        
+        assert URLValidator.validate_url("http://localhost:8080").is_valid is True
+        assert URLValidator.validate_url("http://localhost:8080").is_valid is True
+        assert URLValidator.validate_url("localhost:8080").is_valid is False
+        assert URLValidator.validate_url("//localhost:8080", require_scheme=False).is_valid is True
+        
+        info = validators._validate_url_cached.cache_info()
+        assert (info.hits, info.currsize) == (1, 3)
+    
+    def test_validate_all(self):
+        """Test combining validation results."""
+        assert validate_all(validators.ValidationResult(True), validators.ValidationResult(True)).is_valid is True
+        
+        combined = validate_all(
+            validators.ValidationResult(True),
+            validators.ValidationResult(False, "first", ["fix first"]),
+            validators.ValidationResult(False),
+            validators.ValidationResult(False, "second", ["fix second", "retry"]),
+        )
+        assert combined.is_valid is False
+        assert combined.message == "first; second"
+        assert combined.suggestions == ("fix first", "fix second", "retry")
 
 
 class TestErrorInfo:
@@ -59,6 +59,7 @@ class JsonViewer(ttk.Frame):
         # Current JSON data
         self._json_data: Optional[Any] = None
         self._formatted_json: str = ""
+        self._is_formatted = False
         
         # Create UI elements
         self._create_widgets()
@@ -353,6 +354,8 @@ class JsonViewer(ttk.Frame):
         
         # Scroll to top
         self.text_widget.see('1.0')
+        
+        self._is_formatted = True
     
     def _apply_syntax_highlighting(self):
         """Apply syntax highlighting to the JSON content."""
@@ -393,6 +396,9 @@ class JsonViewer(ttk.Frame):
             error_message: Main error message
             error_details: Optional detailed error information
         """
+        self._json_data = None
+        self._is_formatted = False
+        
         self.text_widget.configure(state=tk.NORMAL)
         self.text_widget.delete('1.0', tk.END)
         
@@ -419,6 +425,9 @@ class JsonViewer(ttk.Frame):
             text: Plain text to display
             title: Optional title
         """
+        self._json_data = None
+        self._is_formatted = False
+        
         self.text_widget.configure(state=tk.NORMAL)
         self.text_widget.delete('1.0', tk.END)
         
@@ -435,6 +444,7 @@ class JsonViewer(ttk.Frame):
         """Clear the JSON viewer content."""
         self._json_data = None
         self._formatted_json = ""
+        self._is_formatted = False
         
         self.text_widget.configure(state=tk.NORMAL)
         self.text_widget.delete('1.0', tk.END)
@@ -463,6 +473,37 @@ class JsonViewer(ttk.Frame):
         """
         return self._json_data
     
+    def is_formatted(self) -> bool:
+        """
+        Check whether the viewer currently shows formatted JSON.
+        
+        Returns:
+            True if the content was produced by display_json or set_text(formatted=True)
+        """
+        return self._is_formatted
+    
+    def set_text(self, text: str, formatted: bool = False):
+        """
+        Replace the viewer content with a single Text.replace call.
+        
+        Args:
+            text: Text to display
+            formatted: Whether the text is already formatted JSON (enables highlighting)
+        """
+        self._formatted_json = text
+        
+        self.text_widget.configure(state=tk.NORMAL)
+        self.text_widget.replace('1.0', tk.END, text)
+        
+        if formatted:
+            self._apply_syntax_highlighting()
+        
+        self._update_line_numbers()
+        self.text_widget.configure(state=tk.DISABLED)
+        self.text_widget.see('1.0')
+        
+        self._is_formatted = formatted
+    
     def set_font_size(self, size: int):
         """
         Set the font size for the text display.
@@ -5,8 +5,10 @@ Provides interface for making requests to specific services with response displa
 import tkinter as tk
 from tkinter import ttk, messagebox
 import asyncio
+import collections
 import json
 import logging
+import zlib
 from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime
 
@@ -18,6 +20,12 @@ from .components.request_form import RequestForm
 from .components.sample_endpoints_panel import SampleEndpointsPanel
 from utils.error_handler import get_error_handler, handle_error, ErrorCategory, ErrorSeverity
 
+# Shared compact encoder for history exports (takes the C encoder fast path)
+_EXPORT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), check_circular=False)
+
+# Responses larger than this are kept zlib-compressed in the request history
+MAX_STORED_RESPONSE_BYTES = 64 * 1024
+
 
 class ServicePanel(ttk.Frame):
     """
@@ -69,10 +77,20 @@ class ServicePanel(ttk.Frame):
         # Request history
         self.request_history: List[Dict[str, Any]] = []
         self.max_history_size = 50
+        # Number of entries dropped from the front; row iids are absolute indices
+        self._history_base = 0
+        # Evicted history dicts kept for reuse to avoid per-request allocation churn
+        self._history_pool: collections.deque = collections.deque(maxlen=self.max_history_size)
+        self._history_dirty = False
+        self._history_flush_id: Optional[str] = None
         
         # Error handling
         self.error_handler = None
         
+        # Pending after/after_idle callback ids, cancelled on destroy
+        self._scheduled: set = set()
+        self._destroyed = False
+        
         # Initialize the panel
         self._initialize_service_data()
         self._setup_error_handling()
@@ -198,6 +216,7 @@ class ServicePanel(ttk.Frame):
         self.history_tab_frame = ttk.Frame(self.response_notebook)
         self.response_notebook.add(self.history_tab_frame, text="History")
         self._create_history_tab()
+        self.response_notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Response controls
         self.clear_response_btn = ttk.Button(
@@ -511,13 +530,38 @@ class ServicePanel(ttk.Frame):
             
             # Schedule result handling with progress updates
             self._schedule_progress_update()
-            self.after(100, self._check_request_result)
+            self._schedule(100, self._check_request_result)
             
         except Exception as e:
             self.logger.error(f"Error starting request: {e}")
             self._handle_request_error(f"Failed to start request: {str(e)}")
             self._handle_panel_error(e, "execute_request_async")
     
+    def _schedule(self, delay_ms: Optional[int], callback: Callable[[], None]) -> str:
+        """
+        Schedule a callback on the Tk event loop and track it for cancellation.
+        
+        Args:
+            delay_ms: Delay in milliseconds, or None to run when idle
+            callback: Callback to invoke
+            
+        Returns:
+            Tk after id of the scheduled callback
+        """
+        after_id = None
+        
+        def _run():
+            self._scheduled.discard(after_id)
+            if not self._destroyed:
+                callback()
+        
+        if delay_ms is None:
+            after_id = self.after_idle(_run)
+        else:
+            after_id = self.after(delay_ms, _run)
+        self._scheduled.add(after_id)
+        return after_id
+    
     def _schedule_progress_update(self):
         """Schedule periodic progress updates during request execution."""
         if self.request_in_progress:
@@ -529,7 +573,7 @@ class ServicePanel(ttk.Frame):
             self._update_status(f"Request in progress{dots} ({elapsed:.1f}s)")
             
             # Schedule next update
-            self.after(500, self._schedule_progress_update)
+            self._schedule(500, self._schedule_progress_update)
     
     async def _async_execute_request(self, endpoint: str, method: str, kwargs: Dict[str, Any]) -> ServiceExecutionResult:
         """
@@ -590,7 +634,7 @@ class ServicePanel(ttk.Frame):
                 self.current_request_future = None
         else:
             # Check again in 100ms
-            self.after(100, self._check_request_result)
+            self._schedule(100, self._check_request_result)
     
     def _handle_request_result(self, result: ServiceExecutionResult):
         """
@@ -919,8 +963,7 @@ class ServicePanel(ttk.Frame):
             
             # Add troubleshooting tips
             tips = self._generate_troubleshooting_tips(error_message)
-            for i, tip in enumerate(tips, 1):
-                tips_text.insert('end', f"{i}. {tip}\n\n")
+            tips_text.insert('end', ''.join(f"{i}. {tip}\n\n" for i, tip in enumerate(tips, 1)))
             
             tips_text.configure(state='disabled')
             
@@ -1135,7 +1178,7 @@ class ServicePanel(ttk.Frame):
             # Format details
             details = []
             details.append(f"Request: {entry['method']} {entry['endpoint']}")
-            details.append(f"Time: {entry['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
+            details.append(f"Time: {entry['timestamp_iso'][:19].replace('T', ' ')}")
             details.append(f"Status: {entry['status_code']} ({'Success' if entry['success'] else 'Failed'})")
             details.append(f"Response Time: {entry['response_time']:.1f}ms" if entry['response_time'] else "Response Time: N/A")
             
@@ -1153,13 +1196,13 @@ class ServicePanel(ttk.Frame):
                 details.append(f"\nRequest Body:\n{entry['body']}")
             
             # Response data
-            if entry['response_data']:
-                details.append(f"\nResponse Data:\n{json.dumps(entry['response_data'], indent=2)}")
+            response_data = self._get_history_response(entry)
+            if response_data:
+                details.append(f"\nResponse Data:\n{json.dumps(response_data, indent=2)}")
             
-            # Update details display
+            # Update details display in a single Tcl call
             self.history_details_text.configure(state='normal')
-            self.history_details_text.delete('1.0', tk.END)
-            self.history_details_text.insert('1.0', '\n'.join(details))
+            self.history_details_text.replace('1.0', tk.END, '\n'.join(details))
             self.history_details_text.configure(state='disabled')
             
         except Exception as e:
@@ -1319,8 +1362,9 @@ class ServicePanel(ttk.Frame):
                 if entry['body']:
                     details.append(f"Body: {entry['body']}")
                 
-                if entry['response_data']:
-                    details.append(f"Response: {json.dumps(entry['response_data'], indent=2)}")
+                response_data = self._get_history_response(entry)
+                if response_data:
+                    details.append(f"Response: {json.dumps(response_data, indent=2)}")
                 
                 # Copy to clipboard
                 request_text = '\n'.join(details)
@@ -1568,7 +1612,7 @@ class ServicePanel(ttk.Frame):
         # Column widths
         self.history_tree.column('#0', width=120)
         self.history_tree.column('method', width=60)
-        self.history_tree.column('endpoint', width=200)
+        self.history_tree.column('endpoint', width=200, minwidth=150, stretch=False)
         self.history_tree.column('status', width=60)
         self.history_tree.column('time', width=80)
         self.history_tree.column('response_time', width=100)
@@ -1608,8 +1652,12 @@ class ServicePanel(ttk.Frame):
             result: Service execution result
         """
         try:
-            history_item = {
-                'timestamp': datetime.now(),
+            # Stringify the capture time once; display and export reuse these
+            now = datetime.now()
+            history_item = self._history_pool.popleft() if self._history_pool else {}
+            history_item.update({
+                'timestamp_iso': now.isoformat(),
+                'timestamp_hms': now.strftime('%H:%M:%S'),
                 'service_name': self.service_name,
                 'method': request_data.get('method', 'GET'),
                 'endpoint': request_data.get('endpoint', ''),
@@ -1618,56 +1666,149 @@ class ServicePanel(ttk.Frame):
                 'status_code': result.status_code,
                 'success': result.success,
                 'response_time': result.response_time,
-                'response_data': result.response_data,
                 'error_message': result.error_message,
                 'execution_time': result.execution_time
-            }
+            })
+            self._store_history_response(history_item, result.response_data)
             
             # Add to history
             self.request_history.append(history_item)
             
             # Limit history size
             if len(self.request_history) > self.max_history_size:
-                self.request_history.pop(0)
+                self._recycle_history_item(self.request_history.pop(0))
+                self._history_base += 1
             
-            # Update history display
-            self._update_history_display()
+            # Redraw lazily; a hidden history tab only gets marked dirty
+            self._request_history_redraw()
             
         except Exception as e:
             self.logger.error(f"Error adding to request history: {e}")
     
+    def _store_history_response(self, item: Dict[str, Any], response_data: Any):
+        """
+        Store response data on a history item, compressing oversized payloads.
+        
+        Args:
+            item: History item to update
+            response_data: Response payload from the request result
+        """
+        item['response_data'] = response_data
+        item['response_blob'] = None
+        item['response_compressed'] = False
+        item['response_is_text'] = isinstance(response_data, str)
+        
+        if response_data is None or isinstance(response_data, (bytes, bytearray)):
+            return
+        
+        if item['response_is_text']:
+            # A str encodes to at most 4 UTF-8 bytes per character, so short
+            # text can be kept as-is without encoding it first
+            if len(response_data) * 4 <= MAX_STORED_RESPONSE_BYTES:
+                return
+            serialized = response_data
+        else:
+            try:
+                serialized = _EXPORT_ENCODER.encode(response_data)
+            except (TypeError, ValueError, RecursionError):
+                return
+        
+        # Encode once; the same bytes are compressed when the payload is large
+        encoded = serialized.encode('utf-8')
+        if len(encoded) > MAX_STORED_RESPONSE_BYTES:
+            item['response_data'] = None
+            item['response_blob'] = zlib.compress(encoded)
+            item['response_compressed'] = True
+    
+    def _get_history_response(self, item: Dict[str, Any]) -> Any:
+        """
+        Get the response data of a history item, inflating it if compressed.
+        
+        Args:
+            item: History item
+            
+        Returns:
+            Response data as originally received
+        """
+        if not item.get('response_compressed'):
+            return item.get('response_data')
+        
+        text = zlib.decompress(item['response_blob']).decode('utf-8')
+        return text if item.get('response_is_text') else json.loads(text)
+    
+    def _recycle_history_item(self, item: Dict[str, Any]):
+        """
+        Return an evicted history dict to the pool after dropping large fields.
+        
+        Args:
+            item: History item removed from request_history
+        """
+        item['response_data'] = None
+        item['response_blob'] = None
+        item['body'] = ''
+        item['headers'] = None
+        self._history_pool.append(item)
+    
+    def _is_history_tab_selected(self) -> bool:
+        """Check whether the history tab is the visible notebook tab."""
+        return self.response_notebook.select() == str(self.history_tab_frame)
+    
+    def _request_history_redraw(self):
+        """Mark the history display dirty and schedule a flush if it is visible."""
+        self._history_dirty = True
+        if self._history_flush_id is None and self._is_history_tab_selected():
+            self._history_flush_id = self._schedule(None, self._flush_history_display)
+    
+    def _flush_history_display(self):
+        """Rebuild the history display if it has pending changes."""
+        self._history_flush_id = None
+        if self._history_dirty:
+            self._history_dirty = False
+            self._update_history_display()
+    
+    def _on_tab_changed(self, event):
+        """Flush pending history changes when the history tab is shown."""
+        if self._history_dirty and self._is_history_tab_selected():
+            self._flush_history_display()
+    
     def _update_history_display(self):
         """Update the history tree view with current history."""
+        if self._destroyed:
+            return
+        
         try:
+            tree = self.history_tree
+            insert = tree.insert
+            
             # Clear existing items
-            for item in self.history_tree.get_children():
-                self.history_tree.delete(item)
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
             
-            # Add history items (most recent first)
+            # Add history items (most recent first), keyed by absolute index
+            last_index = self._history_base + len(self.request_history) - 1
             for i, item in enumerate(reversed(self.request_history)):
-                timestamp_str = item['timestamp'].strftime('%H:%M:%S')
-                status_text = str(item['status_code']) if item['success'] else 'Error'
-                response_time_text = f"{item['response_time']:.1f}ms" if item['response_time'] else 'N/A'
+                response_time = item['response_time']
                 
-                # Insert item
-                tree_item = self.history_tree.insert(
+                # Status carries its success/failure mark directly
+                if item['success']:
+                    status_text = f"✓ {item['status_code']}"
+                else:
+                    status_text = "✗ Error"
+                
+                insert(
                     '',
                     'end',
-                    text=timestamp_str,
+                    iid=str(last_index - i),
+                    text=item['timestamp_hms'],
                     values=(
                         item['method'],
-                        item['endpoint'][:30] + '...' if len(item['endpoint']) > 30 else item['endpoint'],
+                        item['endpoint'],  # Fixed-width column clips long paths
                         status_text,
-                        f"{item['response_time']:.0f}ms" if item['response_time'] else 'N/A',
-                        response_time_text
+                        f"{response_time:.0f}ms" if response_time else 'N/A',
+                        f"{response_time:.1f}ms" if response_time else 'N/A'
                     )
                 )
-                
-                # Color code based on success
-                if item['success']:
-                    self.history_tree.set(tree_item, 'status', f"✓ {status_text}")
-                else:
-                    self.history_tree.set(tree_item, 'status', f"✗ {status_text}")
             
         except Exception as e:
             self.logger.error(f"Error updating history display: {e}")
@@ -1679,8 +1820,8 @@ class ServicePanel(ttk.Frame):
             if not selection:
                 return
             
-            # Get selected item index (reversed because we display most recent first)
-            item_index = len(self.request_history) - 1 - self.history_tree.index(selection[0])
+            # Row iids hold the absolute history index
+            item_index = int(selection[0]) - self._history_base
             
             if 0 <= item_index < len(self.request_history):
                 history_item = self.request_history[item_index]
@@ -1701,7 +1842,7 @@ class ServicePanel(ttk.Frame):
                     'success': history_item['success'],
                     'response_time_ms': history_item['response_time'],
                     'execution_time': history_item['execution_time'].isoformat(),
-                    'response_data': history_item['response_data']
+                    'response_data': self._get_history_response(history_item)
                 }
                 
                 if history_item['error_message']:
@@ -1730,6 +1871,7 @@ class ServicePanel(ttk.Frame):
             )
             
             if result:
+                self._history_base += len(self.request_history)
                 self.request_history.clear()
                 self._update_history_display()
                 self._update_status("Request history cleared")
@@ -1741,7 +1883,6 @@ class ServicePanel(ttk.Frame):
         """Export request history to a file."""
         try:
             from tkinter import filedialog
-            import json
             
             if not self.request_history:
                 messagebox.showinfo("Export History", "No request history to export")
@@ -1765,7 +1906,7 @@ class ServicePanel(ttk.Frame):
                 
                 for item in self.request_history:
                     export_item = {
-                        'timestamp': item['timestamp'].isoformat(),
+                        'timestamp': item['timestamp_iso'],
                         'method': item['method'],
                         'endpoint': item['endpoint'],
                         'headers': item['headers'],
@@ -1773,7 +1914,7 @@ class ServicePanel(ttk.Frame):
                         'status_code': item['status_code'],
                         'success': item['success'],
                         'response_time_ms': item['response_time'],
-                        'response_data': item['response_data'],
+                        'response_data': self._get_history_response(item),
                         'error_message': item['error_message'],
                         'execution_time': item['execution_time'].isoformat()
                     }
@@ -1781,7 +1922,8 @@ class ServicePanel(ttk.Frame):
                 
                 # Write to file
                 with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                    f.write(_EXPORT_ENCODER.encode(export_data))
+                    f.write('\n')
                 
                 messagebox.showinfo("Export Complete", f"Request history exported to {filename}")
                 self._update_status(f"Exported {len(self.request_history)} requests to {filename}")
@@ -1836,9 +1978,21 @@ class ServicePanel(ttk.Frame):
     def _format_response_json(self):
         """Format the response JSON for better readability."""
         try:
-            current_json = self.response_viewer.get_json()
-            if current_json:
-                self.response_viewer.set_json(current_json)
+            # Already formatted content would only be re-parsed and re-inserted unchanged
+            if self.response_viewer.is_formatted():
+                self._update_status("Response JSON already formatted")
+                return
+            
+            current_json = self.response_viewer.get_json_data()
+            if current_json is None:
+                try:
+                    current_json = json.loads(self.response_viewer.get_content())
+                except ValueError:
+                    current_json = None
+            
+            if current_json is not None:
+                formatted = json.dumps(current_json, indent=2, ensure_ascii=False, separators=(',', ': '))
+                self.response_viewer.set_text(formatted, formatted=True)
                 self._update_status("Response JSON formatted")
             else:
                 messagebox.showinfo("Format JSON", "No JSON response data to format")
@@ -1852,5 +2006,14 @@ class ServicePanel(ttk.Frame):
         # Cancel any pending requests
         self.cancel_current_request()
         
+        # Cancel pending callbacks so they never fire on a destroyed widget
+        self._destroyed = True
+        for after_id in self._scheduled:
+            try:
+                self.after_cancel(after_id)
+            except tk.TclError:
+                pass
+        self._scheduled.clear()
+        
         # Call parent destroy
         super().destroy()
\ No newline at end of file
@@ -2,11 +2,121 @@
 Centralized styling system for MCP Dashboard GUI.
 Provides consistent colors, fonts, and styling across all UI components.
 """
-import tkinter as tk
-from tkinter import ttk
-from typing import Dict, Any, Optional
-import sys
-import os
+from __future__ import annotations
+
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+from weakref import WeakValueDictionary
+import weakref
+
+# tkinter is imported lazily so importing the theme stays off the GUI startup path
+if TYPE_CHECKING:
+    from typing import Any, Dict, Mapping, Optional
+    
+    import tkinter as tk
+    from tkinter import font as tkfont
+    from tkinter import ttk
+
+
+class _Colors(NamedTuple):
+    """Color palette - Professional blue/gray theme."""
+    
+    # Primary colors
+    primary: str = '#0366d6'           # GitHub blue
+    primary_dark: str = '#044289'      # Darker blue
+    primary_light: str = '#4285f4'     # Lighter blue
+    
+    # Status colors
+    success: str = '#28a745'           # Green
+    warning: str = '#ffc107'           # Yellow/Orange
+    danger: str = '#dc3545'            # Red
+    info: str = '#17a2b8'              # Cyan
+    
+    # Neutral colors
+    white: str = '#ffffff'
+    light_gray: str = '#f8f9fa'
+    gray: str = '#6c757d'
+    dark_gray: str = '#495057'
+    black: str = '#212529'
+    
+    # Background colors
+    bg_primary: str = '#ffffff'
+    bg_secondary: str = '#f8f9fa'
+    bg_tertiary: str = '#e9ecef'
+    bg_dark: str = '#343a40'
+    
+    # Border colors
+    border_light: str = '#dee2e6'
+    border_medium: str = '#ced4da'
+    border_dark: str = '#6c757d'
+    
+    # Text colors
+    text_primary: str = '#212529'
+    text_secondary: str = '#6c757d'
+    text_muted: str = '#868e96'
+    text_white: str = '#ffffff'
+    
+    # Interactive colors
+    hover: str = '#e9ecef'
+    active: str = '#dee2e6'
+    focus: str = '#80bdff'
+    disabled: str = '#e9ecef'
+    
+    # Service status colors
+    status_healthy: str = '#28a745'
+    status_unhealthy: str = '#dc3545'
+    status_unknown: str = '#6c757d'
+    status_checking: str = '#ffc107'
+    
+    # JSON syntax highlighting
+    json_string: str = '#d73a49'
+    json_number: str = '#005cc5'
+    json_boolean: str = '#e36209'
+    json_null: str = '#6f42c1'
+    json_key: str = '#032f62'
+    json_brace: str = '#24292e'
+
+
+class _Fonts(NamedTuple):
+    """Font configuration."""
+    
+    # System fonts with fallbacks
+    default: tuple = ('Segoe UI', 9)
+    heading: tuple = ('Segoe UI', 12, 'bold')
+    subheading: tuple = ('Segoe UI', 10, 'bold')
+    body: tuple = ('Segoe UI', 9)
+    small: tuple = ('Segoe UI', 8)
+    code: tuple = ('Consolas', 9)
+    code_small: tuple = ('Consolas', 8)
+    
+    # Special purpose fonts
+    title: tuple = ('Segoe UI', 18, 'bold')
+    button: tuple = ('Segoe UI', 9)
+    label: tuple = ('Segoe UI', 9)
+    status: tuple = ('Segoe UI', 8)
+
+
+class _Spacing(NamedTuple):
+    """Spacing and sizing."""
+    
+    xs: int = 2
+    sm: int = 5
+    md: int = 10
+    lg: int = 15
+    xl: int = 20
+    xxl: int = 30
+
+
+# Frozen theme namespaces with attribute access (COLORS.primary)
+COLORS = _Colors()
+FONTS = _Fonts()
+SPACING = _Spacing()
+
+# Read-only name-keyed views for dynamic lookups
+COLORS_DICT = MappingProxyType(COLORS._asdict())
+FONTS_DICT = MappingProxyType(FONTS._asdict())
+SPACING_DICT = MappingProxyType(SPACING._asdict())
 
 
 class MCPTheme:
@@ -15,91 +125,10 @@ class MCPTheme:
     Provides consistent colors, fonts, and styling definitions.
     """
     
-    # Color palette - Professional blue/gray theme
-    COLORS = {
-        # Primary colors
-        'primary': '#0366d6',           # GitHub blue
-        'primary_dark': '#044289',      # Darker blue
-        'primary_light': '#4285f4',     # Lighter blue
-        
-        # Status colors
-        'success': '#28a745',           # Green
-        'warning': '#ffc107',           # Yellow/Orange
-        'danger': '#dc3545',            # Red
-        'info': '#17a2b8',              # Cyan
-        
-        # Neutral colors
-        'white': '#ffffff',
-        'light_gray': '#f8f9fa',
-        'gray': '#6c757d',
-        'dark_gray': '#495057',
-        'black': '#212529',
-        
-        # Background colors
-        'bg_primary': '#ffffff',
-        'bg_secondary': '#f8f9fa',
-        'bg_tertiary': '#e9ecef',
-        'bg_dark': '#343a40',
-        
-        # Border colors
-        'border_light': '#dee2e6',
-        'border_medium': '#ced4da',
-        'border_dark': '#6c757d',
-        
-        # Text colors
-        'text_primary': '#212529',
-        'text_secondary': '#6c757d',
-        'text_muted': '#868e96',
-        'text_white': '#ffffff',
-        
-        # Interactive colors
-        'hover': '#e9ecef',
-        'active': '#dee2e6',
-        'focus': '#80bdff',
-        'disabled': '#e9ecef',
-        
-        # Service status colors
-        'status_healthy': '#28a745',
-        'status_unhealthy': '#dc3545',
-        'status_unknown': '#6c757d',
-        'status_checking': '#ffc107',
-        
-        # JSON syntax highlighting
-        'json_string': '#d73a49',
-        'json_number': '#005cc5',
-        'json_boolean': '#e36209',
-        'json_null': '#6f42c1',
-        'json_key': '#032f62',
-        'json_brace': '#24292e',
-    }
-    
-    # Font configuration
-    FONTS = {
-        # System fonts with fallbacks
-        'default': ('Segoe UI', 9),
-        'heading': ('Segoe UI', 12, 'bold'),
-        'subheading': ('Segoe UI', 10, 'bold'),
-        'body': ('Segoe UI', 9),
-        'small': ('Segoe UI', 8),
-        'code': ('Consolas', 9),
-        'code_small': ('Consolas', 8),
-        
-        # Special purpose fonts
-        'title': ('Segoe UI', 18, 'bold'),
-        'button': ('Segoe UI', 9),
-        'label': ('Segoe UI', 9),
-        'status': ('Segoe UI', 8),
-    }
-    
-    # Spacing and sizing
-    SPACING = {
-        'xs': 2,
-        'sm': 5,
-        'md': 10,
-        'lg': 15,
-        'xl': 20,
-        'xxl': 30,
-    }
+    # Name-keyed views of the module-level theme namespaces
+    COLORS = COLORS_DICT
+    FONTS = FONTS_DICT
+    SPACING = SPACING_DICT
     
     # Window sizing
     WINDOW = {
@@ -121,6 +150,152 @@ class MCPTheme:
     }
 
 
+# Static ttk style table: (style name, configure options, map options or None).
+# Colors and fonts are resolved once at import time.
+_CRITICAL_TTK_STYLE_SPEC = (
+    # Button styles
+    ('TButton', {
+        'font': FONTS.button,
+        'padding': (12, 6),
+        'relief': 'flat',
+        'borderwidth': 1
+    }, {
+        'background': [
+            ('active', COLORS.hover),
+            ('pressed', COLORS.active),
+            ('disabled', COLORS.disabled)
+        ],
+        'bordercolor': [
+            ('focus', COLORS.focus),
+            ('!focus', COLORS.border_medium)
+        ]
+    }),
+    ('Primary.TButton', {
+        'background': COLORS.primary,
+        'foreground': COLORS.text_white,
+        'font': FONTS.button
+    }, {
+        'background': [
+            ('active', COLORS.primary_dark),
+            ('pressed', COLORS.primary_dark),
+            ('disabled', COLORS.disabled)
+        ]
+    }),
+    ('Success.TButton', {
+        'background': COLORS.success,
+        'foreground': COLORS.text_white
+    }, None),
+    ('Warning.TButton', {
+        'background': COLORS.warning,
+        'foreground': COLORS.text_primary
+    }, None),
+    ('Danger.TButton', {
+        'background': COLORS.danger,
+        'foreground': COLORS.text_white
+    }, None),
+    # Accent button style (for selected items)
+    ('Accent.TButton', {
+        'background': COLORS.primary_light,
+        'foreground': COLORS.text_white,
+        'relief': 'solid',
+        'borderwidth': 2,
+        'bordercolor': COLORS.primary
+    }, None),
+    # Frame styles
+    ('Card.TFrame', {
+        'background': COLORS.bg_primary,
+        'relief': 'solid',
+        'borderwidth': 1,
+        'bordercolor': COLORS.border_light
+    }, None),
+    ('Sidebar.TFrame', {
+        'background': COLORS.bg_secondary,
+        'relief': 'solid',
+        'borderwidth': 1,
+        'bordercolor': COLORS.border_light
+    }, None),
+    # Label styles
+    ('Heading.TLabel', {
+        'font': FONTS.heading,
+        'foreground': COLORS.text_primary
+    }, None),
+    ('Subheading.TLabel', {
+        'font': FONTS.subheading,
+        'foreground': COLORS.text_primary
+    }, None),
+    ('Body.TLabel', {
+        'font': FONTS.body,
+        'foreground': COLORS.text_primary
+    }, None),
+    ('Muted.TLabel', {
+        'font': FONTS.body,
+        'foreground': COLORS.text_muted
+    }, None),
+    ('Status.TLabel', {
+        'font': FONTS.status,
+        'foreground': COLORS.text_secondary
+    }, None),
+    # Entry styles
+    ('TEntry', {
+        'font': FONTS.body,
+        'fieldbackground': COLORS.bg_primary,
+        'bordercolor': COLORS.border_medium,
+        'insertcolor': COLORS.text_primary
+    }, {
+        'bordercolor': [
+            ('focus', COLORS.focus),
+            ('!focus', COLORS.border_medium)
+        ]
+    }),
+)
+
+_DEFERRED_TTK_STYLE_SPEC = (
+    # Notebook (tab) styles
+    ('TNotebook', {
+        'background': COLORS.bg_secondary,
+        'borderwidth': 0
+    }, None),
+    ('TNotebook.Tab', {
+        'font': FONTS.body,
+        'padding': (12, 8),
+        'background': COLORS.bg_tertiary,
+        'foreground': COLORS.text_secondary
+    }, {
+        'background': [
+            ('selected', COLORS.bg_primary),
+            ('active', COLORS.hover)
+        ],
+        'foreground': [
+            ('selected', COLORS.text_primary),
+            ('active', COLORS.text_primary)
+        ]
+    }),
+    # Treeview styles
+    ('Treeview', {
+        'font': FONTS.body,
+        'background': COLORS.bg_primary,
+        'foreground': COLORS.text_primary,
+        'fieldbackground': COLORS.bg_primary,
+        'borderwidth': 1,
+        'relief': 'solid'
+    }, None),
+    ('Treeview.Heading', {
+        'font': FONTS.subheading,
+        'background': COLORS.bg_secondary,
+        'foreground': COLORS.text_primary,
+        'relief': 'flat'
+    }, None),
+    # Progressbar styles
+    ('TProgressbar', {
+        'background': COLORS.primary,
+        'troughcolor': COLORS.bg_tertiary,
+        'borderwidth': 0,
+        'lightcolor': COLORS.primary,
+        'darkcolor': COLORS.primary
+    }, None),
+)
+
+
 class StyleManager:
     """
     Manages application-wide styling and theme application.
@@ -131,21 +306,64 @@ class StyleManager:
         """
         Initialize style manager.
         
+        Only the styles needed for the first paint are configured here;
+        the rest are applied once the event loop goes idle.
+        
         Args:
             root: Root Tk window
         """
+        from tkinter import ttk
+        
         self.root = root
         self.style = ttk.Style()
         self.theme = MCPTheme()
         
-        # Configure ttk styles
-        self._configure_ttk_styles()
+        # Theme tables bound directly for the hot lookup getters
+        self._colors = COLORS_DICT
+        self._fonts = FONTS_DICT
+        self._spacing = SPACING_DICT
+        
+        # Named Tk fonts shared by all text widgets, created on first use
+        self._font_objects: Dict[str, Any] = {}
+        
+        # Resolve font families so Tk does not search for missing ones per widget
+        self._font_remap: Dict[tuple, tuple] = {}
+        self._resolve_fonts()
+        
+        # A Tcl interpreter that already carries the styles needs no reconfiguration
+        if self._styles_configured():
+            return
+        
+        # Configure ttk styles used by first-paint widgets
+        self._configure_critical_ttk_styles()
         
         # Set up custom styles
         self._setup_custom_styles()
+        
+        # Configure remaining styles after the first frame is visible
+        self.root.after_idle(self._configure_deferred_ttk_styles)
+    
+    def _styles_configured(self) -> bool:
+        """Check whether this root's Tcl interpreter is already fully styled."""
+        return id(self.root.tk) in _CONFIGURED_INTERPS
+    
+    def _mark_styles_configured(self):
+        """Record this root's Tcl interpreter as styled until the root is collected."""
+        interp_id = id(self.root.tk)
+        if interp_id not in _CONFIGURED_INTERPS:
+            _CONFIGURED_INTERPS.add(interp_id)
+            weakref.finalize(self.root, _CONFIGURED_INTERPS.discard, interp_id)
     
     def _configure_ttk_styles(self):
-        """Configure ttk widget styles."""
+        """Configure all ttk widget styles."""
+        if self._styles_configured():
+            return
+        
+        self._configure_critical_ttk_styles()
+        self._configure_deferred_ttk_styles()
+    
+    def _configure_critical_ttk_styles(self):
+        """Configure button, frame, label and entry styles needed for first paint."""
         # Use a modern theme as base
         available_themes = self.style.theme_names()
         
@@ -156,204 +374,157 @@ class StyleManager:
         else:
             self.style.theme_use('default')
         
-        # Configure button styles
-        self.style.configure(
-            'TButton',
-            font=self.theme.FONTS['button'],
-            padding=(12, 6),
-            relief='flat',
-            borderwidth=1
-        )
-        
-        self.style.map(
-            'TButton',
-            background=[
-                ('active', self.theme.COLORS['hover']),
-                ('pressed', self.theme.COLORS['active']),
-                ('disabled', self.theme.COLORS['disabled'])
-            ],
-            bordercolor=[
-                ('focus', self.theme.COLORS['focus']),
-                ('!focus', self.theme.COLORS['border_medium'])
-            ]
-        )
-        
-        # Primary button style
-        self.style.configure(
-            'Primary.TButton',
-            background=self.theme.COLORS['primary'],
-            foreground=self.theme.COLORS['text_white'],
-            font=self.theme.FONTS['button']
-        )
-        
-        self.style.map(
-            'Primary.TButton',
-            background=[
-                ('active', self.theme.COLORS['primary_dark']),
-                ('pressed', self.theme.COLORS['primary_dark']),
-                ('disabled', self.theme.COLORS['disabled'])
-            ]
-        )
-        
-        # Success button style
-        self.style.configure(
-            'Success.TButton',
-            background=self.theme.COLORS['success'],
-            foreground=self.theme.COLORS['text_white']
-        )
-        
-        # Warning button style
-        self.style.configure(
-            'Warning.TButton',
-            background=self.theme.COLORS['warning'],
-            foreground=self.theme.COLORS['text_primary']
-        )
-        
-        # Danger button style
-        self.style.configure(
-            'Danger.TButton',
-            background=self.theme.COLORS['danger'],
-            foreground=self.theme.COLORS['text_white']
-        )
-        
-        # Accent button style (for selected items)
-        self.style.configure(
-            'Accent.TButton',
-            background=self.theme.COLORS['primary_light'],
-            foreground=self.theme.COLORS['text_white'],
-            relief='solid',
-            borderwidth=2,
-            bordercolor=self.theme.COLORS['primary']
-        )
-        
-        # Configure frame styles
-        self.style.configure(
-            'Card.TFrame',
-            background=self.theme.COLORS['bg_primary'],
-            relief='solid',
-            borderwidth=1,
-            bordercolor=self.theme.COLORS['border_light']
-        )
-        
-        self.style.configure(
-            'Sidebar.TFrame',
-            background=self.theme.COLORS['bg_secondary'],
-            relief='solid',
-            borderwidth=1,
-            bordercolor=self.theme.COLORS['border_light']
-        )
-        
-        # Configure label styles
-        self.style.configure(
-            'Heading.TLabel',
-            font=self.theme.FONTS['heading'],
-            foreground=self.theme.COLORS['text_primary']
-        )
-        
-        self.style.configure(
-            'Subheading.TLabel',
-            font=self.theme.FONTS['subheading'],
-            foreground=self.theme.COLORS['text_primary']
-        )
-        
-        self.style.configure(
-            'Body.TLabel',
-            font=self.theme.FONTS['body'],
-            foreground=self.theme.COLORS['text_primary']
-        )
-        
-        self.style.configure(
-            'Muted.TLabel',
-            font=self.theme.FONTS['body'],
-            foreground=self.theme.COLORS['text_muted']
-        )
-        
-        self.style.configure(
-            'Status.TLabel',
-            font=self.theme.FONTS['status'],
-            foreground=self.theme.COLORS['text_secondary']
-        )
-        
-        # Configure entry styles
-        self.style.configure(
-            'TEntry',
-            font=self.theme.FONTS['body'],
-            fieldbackground=self.theme.COLORS['bg_primary'],
-            bordercolor=self.theme.COLORS['border_medium'],
-            insertcolor=self.theme.COLORS['text_primary']
-        )
-        
-        self.style.map(
-            'TEntry',
-            bordercolor=[
-                ('focus', self.theme.COLORS['focus']),
-                ('!focus', self.theme.COLORS['border_medium'])
-            ]
-        )
-        
-        # Configure notebook (tab) styles
-        self.style.configure(
-            'TNotebook',
-            background=self.theme.COLORS['bg_secondary'],
-            borderwidth=0
-        )
-        
-        self.style.configure(
-            'TNotebook.Tab',
-            font=self.theme.FONTS['body'],
-            padding=(12, 8),
-            background=self.theme.COLORS['bg_tertiary'],
-            foreground=self.theme.COLORS['text_secondary']
-        )
-        
-        self.style.map(
-            'TNotebook.Tab',
-            background=[
-                ('selected', self.theme.COLORS['bg_primary']),
-                ('active', self.theme.COLORS['hover'])
-            ],
-            foreground=[
-                ('selected', self.theme.COLORS['text_primary']),
-                ('active', self.theme.COLORS['text_primary'])
-            ]
-        )
-        
-        # Configure treeview styles
-        self.style.configure(
-            'Treeview',
-            font=self.theme.FONTS['body'],
-            background=self.theme.COLORS['bg_primary'],
-            foreground=self.theme.COLORS['text_primary'],
-            fieldbackground=self.theme.COLORS['bg_primary'],
-            borderwidth=1,
-            relief='solid'
-        )
-        
-        self.style.configure(
-            'Treeview.Heading',
-            font=self.theme.FONTS['subheading'],
-            background=self.theme.COLORS['bg_secondary'],
-            foreground=self.theme.COLORS['text_primary'],
-            relief='flat'
-        )
-        
-        # Configure progressbar styles
-        self.style.configure(
-            'TProgressbar',
-            background=self.theme.COLORS['primary'],
-            troughcolor=self.theme.COLORS['bg_tertiary'],
-            borderwidth=0,
-            lightcolor=self.theme.COLORS['primary'],
-            darkcolor=self.theme.COLORS['primary']
-        )
+        self._apply_style_spec(_CRITICAL_TTK_STYLE_SPEC)
+    
+    def _configure_deferred_ttk_styles(self):
+        """Configure notebook, treeview and progressbar styles."""
+        self._apply_style_spec(_DEFERRED_TTK_STYLE_SPEC)
+        self._mark_styles_configured()
+    
+    def _resolve_fonts(self):
+        """Resolve theme font families against the fonts installed on this system."""
+        global _RESOLVED_FONTS
+        
+        if _RESOLVED_FONTS is None:
+            from tkinter import font as tkfont
+            
+            available = set(tkfont.families(root=self.root))
+            families = {}
+            for family, (preferred, named_font) in _FONT_FALLBACKS.items():
+                for candidate in preferred:
+                    if candidate in available:
+                        families[family] = candidate
+                        break
+                else:
+                    families[family] = tkfont.Font(root=self.root, name=named_font, exists=True).actual('family')
+            
+            _RESOLVED_FONTS = MappingProxyType({
+                name: (families.get(spec[0], spec[0]),) + spec[1:]
+                for name, spec in FONTS_DICT.items()
+            })
+        
+        self._fonts = _RESOLVED_FONTS
+        self._font_remap = {
+            spec: self._fonts[name]
+            for name, spec in FONTS_DICT.items()
+            if spec != self._fonts[name]
+        }
+    
+    def _iter_style_spec(self, spec):
+        """
+        Iterate a static style table with resolved fonts substituted.
+        
+        Args:
+            spec: Sequence of (style name, configure options, map options or None)
+            
+        Yields:
+            (style name, configure options, map options or None)
+        """
+        font_remap = self._font_remap
+        for name, config, mapping in spec:
+            if font_remap and 'font' in config:
+                config = dict(config, font=font_remap.get(config['font'], config['font']))
+            yield name, config, mapping
+    
+    def _build_style_script(self, spec) -> str:
+        """
+        Build a Tcl script with one ttk::style command per table entry.
+        
+        Args:
+            spec: Sequence of (style name, configure options, map options or None)
+            
+        Returns:
+            Tcl script equivalent to the style.configure/style.map calls
+        """
+        from tkinter import _stringify
+        from tkinter.ttk import _format_mapdict, _format_optdict
+        
+        style_cmd = self.style._name
+        commands = []
+        for name, config, mapping in self._iter_style_spec(spec):
+            words = (style_cmd, 'configure', name) + _format_optdict(config)
+            commands.append(' '.join(map(_stringify, words)))
+            if mapping:
+                words = (style_cmd, 'map', name) + _format_mapdict(mapping)
+                commands.append(' '.join(map(_stringify, words)))
+        return '\n'.join(commands)
+    
+    def _apply_style_spec(self, spec):
+        """
+        Apply a static style table to the ttk style database.
+        
+        The whole table is sent to Tcl as a single script built with
+        tkinter's private formatting helpers; the per-style Python calls
+        are used if those helpers are unavailable or the evaluation fails.
+        
+        Args:
+            spec: Sequence of (style name, configure options, map options or None)
+        """
+        import tkinter as tk
+        
+        try:
+            script = self._build_style_script(spec)
+            self.root.tk.eval(script)
+            return
+        except (ImportError, AttributeError, tk.TclError):
+            pass
+        
+        configure = self.style.configure
+        style_map = self.style.map
+        for name, config, mapping in self._iter_style_spec(spec):
+            configure(name, **config)
+            if mapping:
+                style_map(name, **mapping)
     
     def _setup_custom_styles(self):
         """Set up custom widget styles not covered by ttk."""
-        # Configure root window
-        self.root.configure(bg=self.theme.COLORS['bg_secondary'])
-        
         # Set default font for tk widgets
-        self.root.option_add('*Font', self.theme.FONTS['default'])
+        self.root.option_add('*Font', self._fonts['default'])
+        
+        # Set the root background before the first paint, only if needed;
+        # each change re-dispatches <Configure>
+        if self.root.cget('bg') != COLORS.bg_secondary:
+            self.root.configure(bg=COLORS.bg_secondary)
+    
+    def _get_font_object(self, font_type: str) -> tkfont.Font:
+        """
+        Get the shared named Tk font for a theme font.
+        
+        Args:
+            font_type: Font name from theme (unknown names fall back to 'code')
+            
+        Returns:
+            Named Font object registered as MCP.<font_type>
+        """
+        font_object = self._font_objects.get(font_type)
+        if font_object is not None:
+            return font_object
+        
+        import tkinter as tk
+        from tkinter import font as tkfont
+        
+        spec = self._fonts.get(font_type)
+        if spec is None:
+            font_type, spec = 'code', self._fonts['code']
+            font_object = self._font_objects.get(font_type)
+            if font_object is not None:
+                return font_object
+        
+        options = {
+            'family': spec[0],
+            'size': spec[1],
+            'weight': 'bold' if 'bold' in spec[2:] else 'normal'
+        }
+        name = f'MCP.{font_type}'
+        try:
+            font_object = tkfont.Font(root=self.root, name=name, **options)
+        except tk.TclError:
+            # Already registered in this interpreter (e.g. a second StyleManager)
+            font_object = tkfont.Font(root=self.root, name=name, exists=True)
+            font_object.configure(**options)
+        
+        self._font_objects[font_type] = font_object
+        return font_object
     
     def apply_card_style(self, frame: ttk.Frame):
         """
@@ -394,27 +565,15 @@ class StyleManager:
         Returns:
             Configured Text widget
         """
-        defaults = {
-            'font': self.theme.FONTS.get(font_type, self.theme.FONTS['code']),
-            'bg': self.theme.COLORS['bg_primary'],
-            'fg': self.theme.COLORS['text_primary'],
-            'selectbackground': self.theme.COLORS['primary'],
-            'selectforeground': self.theme.COLORS['text_white'],
-            'insertbackground': self.theme.COLORS['text_primary'],
-            'relief': 'solid',
-            'borderwidth': 1,
-            'highlightcolor': self.theme.COLORS['focus'],
-            'highlightbackground': self.theme.COLORS['border_medium'],
-            'highlightthickness': 1,
-            'wrap': tk.WORD,
-            'width': width,
-            'height': height
-        }
+        import tkinter as tk
         
-        # Merge with provided kwargs
-        defaults.update(kwargs)
-        
-        return tk.Text(parent, **defaults)
+        return tk.Text(parent, **{
+            **_TEXT_WIDGET_DEFAULTS,
+            'font': self._get_font_object(font_type),
+            'width': width,
+            'height': height,
+            **kwargs
+        })
     
     def create_styled_canvas(
         self, 
@@ -435,16 +594,14 @@ class StyleManager:
         Returns:
             Configured Canvas widget
         """
-        defaults = {
-            'bg': self.theme.COLORS['bg_primary'],
-            'highlightthickness': 0,
-            'relief': 'flat',
-            'width': width,
-            'height': height
-        }
+        import tkinter as tk
         
-        defaults.update(kwargs)
-        return tk.Canvas(parent, **defaults)
+        return tk.Canvas(parent, **{
+            **_CANVAS_DEFAULTS,
+            'width': width,
+            'height': height,
+            **kwargs
+        })
     
     def get_color(self, color_name: str) -> str:
         """
@@ -456,7 +613,7 @@ class StyleManager:
         Returns:
             Color hex value
         """
-        return self.theme.COLORS.get(color_name, '#000000')
+        return self._colors.get(color_name, '#000000')
     
     def get_font(self, font_name: str) -> tuple:
         """
@@ -468,7 +625,8 @@ class StyleManager:
         Returns:
             Font tuple (family, size, style)
         """
-        return self.theme.FONTS.get(font_name, self.theme.FONTS['default'])
+        fonts = self._fonts
+        return fonts.get(font_name) or fonts['default']
     
     def get_spacing(self, size: str) -> int:
         """
@@ -480,70 +638,156 @@ class StyleManager:
         Returns:
             Spacing value in pixels
         """
-        return self.theme.SPACING.get(size, 10)
+        return self._spacing.get(size, 10)
+
+
+# Pre-baked widget defaults for the styled widget factories
+_TEXT_WIDGET_DEFAULTS = MappingProxyType({
+    'bg': COLORS.bg_primary,
+    'fg': COLORS.text_primary,
+    'selectbackground': COLORS.primary,
+    'selectforeground': COLORS.text_white,
+    'insertbackground': COLORS.text_primary,
+    'relief': 'solid',
+    'borderwidth': 1,
+    'highlightcolor': COLORS.focus,
+    'highlightbackground': COLORS.border_medium,
+    'highlightthickness': 1,
+    'wrap': 'word',
+})
+
+_CANVAS_DEFAULTS = MappingProxyType({
+    'bg': COLORS.bg_primary,
+    'highlightthickness': 0,
+    'relief': 'flat',
+})
+
+# Status and JSON syntax color maps handed out by the factory functions,
+# as (public key, theme color name) pairs resolved with one itemgetter call
+_STATUS_KEY_TO_COLOR_KEY = (
+    ('healthy', 'status_healthy'),
+    ('unhealthy', 'status_unhealthy'),
+    ('unknown', 'status_unknown'),
+    ('checking', 'status_checking'),
+    ('success', 'success'),
+    ('warning', 'warning'),
+    ('danger', 'danger'),
+    ('info', 'info'),
+)
+
+_JSON_KEY_TO_COLOR_KEY = (
+    ('string', 'json_string'),
+    ('number', 'json_number'),
+    ('boolean', 'json_boolean'),
+    ('null', 'json_null'),
+    ('key', 'json_key'),
+    ('brace', 'json_brace'),
+)
+
+
+def _build_color_map(key_pairs) -> Mapping[str, str]:
+    """
+    Build a read-only color map from (public key, theme color name) pairs.
+    
+    Args:
+        key_pairs: Sequence of (public key, theme color name) tuples
+        
+    Returns:
+        Read-only mapping of public keys to colors
+    """
+    keys, color_keys = zip(*key_pairs)
+    return MappingProxyType(dict(zip(keys, itemgetter(*color_keys)(COLORS_DICT))))
+
+
+_STATUS_COLORS = _build_color_map(_STATUS_KEY_TO_COLOR_KEY)
+_JSON_SYNTAX_COLORS = _build_color_map(_JSON_KEY_TO_COLOR_KEY)
+
+# Preferred font families, tried in order; the Tk named font is the last resort
+_FONT_FALLBACKS = {
+    'Segoe UI': (('Segoe UI', 'DejaVu Sans', 'Helvetica'), 'TkDefaultFont'),
+    'Consolas': (('Consolas', 'DejaVu Sans Mono', 'Courier New'), 'TkFixedFont'),
+}
+
+# Theme fonts with families resolved against the installed fonts, once per process
+_RESOLVED_FONTS: Optional[Mapping[str, tuple]] = None
+
+# Resolved application icon path, looked up once per process
+_ICON_PATH: Optional[str] = None
+_ICON_CHECKED = False
+
+# ids of Tcl interpreters whose ttk styles are fully configured; an entry is
+# discarded by weakref.finalize when its root is garbage collected
+_CONFIGURED_INTERPS: set = set()
+
+# Live style managers keyed by id(root); entries vanish with their manager
+_STYLE_MANAGERS: WeakValueDictionary[int, StyleManager] = WeakValueDictionary()
 
 
 def apply_global_styles(root: tk.Tk) -> StyleManager:
     """
     Apply global styles to the application.
     
+    Repeated calls for the same root return the existing StyleManager
+    without reconfiguring ttk styles.
+    
     Args:
         root: Root Tk window
         
     Returns:
         StyleManager instance
     """
+    style_manager = _STYLE_MANAGERS.get(id(root))
+    if style_manager is not None and style_manager.root is root:
+        return style_manager
+    
     style_manager = StyleManager(root)
+    _STYLE_MANAGERS[id(root)] = style_manager
+    
+    # Set window icon if available, off the first-paint path
+    root.after_idle(_set_window_icon, root)
     
-    # Configure window properties
-    root.configure(bg=style_manager.theme.COLORS['bg_secondary'])
+    return style_manager
+
+
+def _set_window_icon(root: tk.Tk):
+    """
+    Set the application icon, resolving its path only once per process.
+    
+    Args:
+        root: Root Tk window
+    """
+    global _ICON_PATH, _ICON_CHECKED
     
-    # Set window icon if available
     try:
-        # Try to set application icon
-        icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'icon.ico')
-        if os.path.exists(icon_path):
-            root.iconbitmap(icon_path)
+        if not _ICON_CHECKED:
+            import os
+            
+            icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'icon.ico')
+            _ICON_PATH = icon_path if os.path.exists(icon_path) else None
+            _ICON_CHECKED = True
+        
+        if _ICON_PATH:
+            root.iconbitmap(_ICON_PATH)
     except Exception:
         # Fallback - no icon
         pass
-    
-    return style_manager
 
 
-def create_status_colors() -> Dict[str, str]:
+def create_status_colors() -> Mapping[str, str]:
     """
     Create a dictionary of status colors for easy access.
     
     Returns:
-        Dictionary mapping status names to colors
+        Read-only mapping of status names to colors (shared)
     """
-    theme = MCPTheme()
-    return {
-        'healthy': theme.COLORS['status_healthy'],
-        'unhealthy': theme.COLORS['status_unhealthy'],
-        'unknown': theme.COLORS['status_unknown'],
-        'checking': theme.COLORS['status_checking'],
-        'success': theme.COLORS['success'],
-        'warning': theme.COLORS['warning'],
-        'danger': theme.COLORS['danger'],
-        'info': theme.COLORS['info']
-    }
+    return _STATUS_COLORS
 
 
-def create_json_syntax_colors() -> Dict[str, str]:
+def create_json_syntax_colors() -> Mapping[str, str]:
     """
     Create a dictionary of JSON syntax highlighting colors.
     
     Returns:
-        Dictionary mapping JSON element types to colors
+        Read-only mapping of JSON element types to colors (shared)
     """
-    theme = MCPTheme()
-    return {
-        'string': theme.COLORS['json_string'],
-        'number': theme.COLORS['json_number'],
-        'boolean': theme.COLORS['json_boolean'],
-        'null': theme.COLORS['json_null'],
-        'key': theme.COLORS['json_key'],
-        'brace': theme.COLORS['json_brace']
-    }
\ No newline at end of file
+    return _JSON_SYNTAX_COLORS
@@ -2,14 +2,18 @@
 Error handling utilities for MCP Dashboard application.
 Provides centralized error handling, user-friendly error messages, and error dialogs.
 """
+import sys
 import tkinter as tk
 from tkinter import messagebox
 import traceback
-from typing import Optional, Dict, Any, Callable, Union
+import queue
+from collections import deque
+from typing import Optional, Dict, Any, List, Callable, Union, Tuple, Pattern, FrozenSet
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 import logging
+import re
 
 from .logger import get_logger
 
@@ -34,9 +38,144 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+_USER_MESSAGES: Dict[ErrorCategory, str] = {
+    ErrorCategory.CONFIGURATION: "There's an issue with the application configuration. Please check your settings.",
+    ErrorCategory.NETWORK: "Unable to connect to the service. Please check your network connection.",
+    ErrorCategory.SERVICE: "The service is currently unavailable. Please try again later.",
+    ErrorCategory.AUTHENTICATION: "Authentication failed. Please check your credentials.",
+    ErrorCategory.TIMEOUT: "The request took too long to complete. Please try again.",
+    ErrorCategory.VALIDATION: "The provided input is not valid. Please check and try again.",
+    ErrorCategory.UI: "An interface error occurred. Please restart the application if the problem persists.",
+}
+_DEFAULT_USER_MESSAGE = "An unexpected error occurred. Please try again or contact support."
+
+_SUGGESTED_ACTIONS: Dict[ErrorCategory, Tuple[str, ...]] = {
+    ErrorCategory.NETWORK: (
+        "Check your internet connection",
+        "Verify the service URL is correct",
+        "Try again in a few moments",
+        "Check if the service is running"
+    ),
+    ErrorCategory.CONFIGURATION: (
+        "Check your .env configuration file",
+        "Verify all required settings are present",
+        "Restart the application",
+        "Check the documentation for configuration requirements"
+    ),
+    ErrorCategory.SERVICE: (
+        "Check if the service is running",
+        "Verify the service endpoint URL",
+        "Try refreshing the service list",
+        "Contact the service administrator"
+    ),
+    ErrorCategory.AUTHENTICATION: (
+        "Check your authentication credentials",
+        "Verify your API key or token",
+        "Check if your credentials have expired",
+        "Contact your administrator for access"
+    ),
+    ErrorCategory.TIMEOUT: (
+        "Try the request again",
+        "Check your network connection",
+        "Increase timeout settings if possible",
+        "Try with a smaller request"
+    ),
+    ErrorCategory.VALIDATION: (
+        "Check your input format",
+        "Verify all required fields are filled",
+        "Check for special characters or invalid data",
+        "Refer to the API documentation"
+    ),
+    ErrorCategory.UI: (
+        "Try refreshing the interface",
+        "Restart the application",
+        "Check if your display settings are correct",
+        "Report this issue if it persists"
+    ),
+}
+_DEFAULT_SUGGESTED_ACTIONS: Tuple[str, ...] = (
+    "Try the operation again",
+    "Restart the application if the problem persists",
+    "Check the application logs for more details",
+    "Contact support if the issue continues"
+)
+
+_SEVERITY_RANK: Dict[ErrorSeverity, int] = {
+    ErrorSeverity.INFO: 0,
+    ErrorSeverity.WARNING: 1,
+    ErrorSeverity.ERROR: 2,
+    ErrorSeverity.CRITICAL: 3,
+}
+
+
+_SEVERITY_LOG_LEVELS: Dict[ErrorSeverity, int] = {
+    ErrorSeverity.INFO: logging.INFO,
+    ErrorSeverity.WARNING: logging.WARNING,
+    ErrorSeverity.ERROR: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+}
+
+
+def _severity_rank(error_info: 'ErrorInfo') -> int:
+    """Sort key ordering errors from least to most severe."""
+    return _SEVERITY_RANK.get(error_info.severity, 0)
+
+
+_TYPE_NAME = 0
+_MESSAGE = 1
+
+
+_NETWORK_TYPE_KEYWORDS = frozenset({'connection', 'timeout', 'network', 'socket', 'http'})
+_NETWORK_MESSAGE_KEYWORDS = frozenset({'connection', 'timeout', 'network', 'unreachable', 'refused'})
+_CONFIGURATION_MESSAGE_KEYWORDS = frozenset({'config', 'setting', 'environment', 'missing', 'not found'})
+_AUTHENTICATION_MESSAGE_KEYWORDS = frozenset({'auth', 'credential', 'token', 'unauthorized', 'forbidden'})
+_VALIDATION_TYPE_KEYWORDS = frozenset({'value', 'type', 'attribute', 'key'})
+_UI_TYPE_KEYWORDS = frozenset({'tk', 'widget', 'gui', 'display'})
+_SERVICE_MESSAGE_KEYWORDS = frozenset({'service', 'server', 'api', 'endpoint'})
+
+
+def _keyword_pattern(keywords: FrozenSet[str]) -> Pattern:
+    """
+    Compile a keyword set into a single substring-matching alternation.
+    
+    Keywords containing another keyword of the same set can never change
+    the outcome of a search, so they are left out of the pattern.
+    """
+    minimal = sorted(
+        keyword for keyword in keywords
+        if not any(other != keyword and other in keyword for other in keywords)
+    )
+    return re.compile('|'.join(map(re.escape, minimal)))
+
+
+# Ordered categorization rules: the first rule whose keywords appear in the
+# lowercased exception type name or message decides the category.
+_CATEGORY_RULES: Tuple[Tuple[int, Pattern, ErrorCategory], ...] = (
+    (_TYPE_NAME, _keyword_pattern(_NETWORK_TYPE_KEYWORDS), ErrorCategory.NETWORK),
+    (_MESSAGE, _keyword_pattern(_NETWORK_MESSAGE_KEYWORDS), ErrorCategory.NETWORK),
+    (_MESSAGE, _keyword_pattern(_CONFIGURATION_MESSAGE_KEYWORDS), ErrorCategory.CONFIGURATION),
+    (_MESSAGE, _keyword_pattern(_AUTHENTICATION_MESSAGE_KEYWORDS), ErrorCategory.AUTHENTICATION),
+    (_TYPE_NAME, _keyword_pattern(_VALIDATION_TYPE_KEYWORDS), ErrorCategory.VALIDATION),
+    (_TYPE_NAME, _keyword_pattern(_UI_TYPE_KEYWORDS), ErrorCategory.UI),
+    (_MESSAGE, _keyword_pattern(_SERVICE_MESSAGE_KEYWORDS), ErrorCategory.SERVICE),
+)
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ErrorInfo:
-    """Information about an error."""
+    """
+    Information about an error.
+    
+    For errors built from an exception, technical_details stays None until
+    get_technical_details() formats it from exception_summary and
+    stack_summary; read it through that method rather than the field.
+    The stack is captured without frames so history entries do not keep
+    the failing call's locals alive.
+    """
     category: ErrorCategory
     severity: ErrorSeverity
     message: str
@@ -45,6 +184,8 @@ class ErrorInfo:
     suggested_actions: Optional[list] = None
     timestamp: Optional[datetime] = None
     context: Optional[Dict[str, Any]] = None
+    exception_summary: Optional[str] = field(default=None, repr=False, compare=False)
+    stack_summary: Optional[traceback.StackSummary] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -53,31 +194,23 @@ class ErrorInfo:
         if self.user_message is None:
             self.user_message = self._generate_user_friendly_message()
     
+    def has_technical_details(self) -> bool:
+        """Check whether technical details are available or can be built."""
+        return bool(self.technical_details) or self.exception_summary is not None
+    
+    def get_technical_details(self) -> Optional[str]:
+        """Get technical details, formatting the captured exception on first use."""
+        if self.technical_details is None and self.exception_summary is not None:
+            technical_details = self.exception_summary
+            if self.stack_summary:
+                technical_details += "\n\nTraceback:\n" + "".join(self.stack_summary.format())
+            self.technical_details = technical_details
+        
+        return self.technical_details
+    
     def _generate_user_friendly_message(self) -> str:
         """Generate a user-friendly error message."""
-        if self.category == ErrorCategory.CONFIGURATION:
-            return "There's an issue with the application configuration. Please check your settings."
-        
-        elif self.category == ErrorCategory.NETWORK:
-            return "Unable to connect to the service. Please check your network connection."
-        
-        elif self.category == ErrorCategory.SERVICE:
-            return "The service is currently unavailable. Please try again later."
-        
-        elif self.category == ErrorCategory.AUTHENTICATION:
-            return "Authentication failed. Please check your credentials."
-        
-        elif self.category == ErrorCategory.TIMEOUT:
-            return "The request took too long to complete. Please try again."
-        
-        elif self.category == ErrorCategory.VALIDATION:
-            return "The provided input is not valid. Please check and try again."
-        
-        elif self.category == ErrorCategory.UI:
-            return "An interface error occurred. Please restart the application if the problem persists."
-        
-        else:
-            return "An unexpected error occurred. Please try again or contact support."
+        return _USER_MESSAGES.get(self.category, _DEFAULT_USER_MESSAGE)
 
 
 class ErrorHandler:
@@ -90,8 +223,26 @@ class ErrorHandler:
         self.parent_window = parent_window
         self.logger = get_logger("ErrorHandler")
         self.error_callbacks: Dict[ErrorCategory, list] = {}
-        self.error_history: list = []
         self.max_history_size = 100
+        self.error_history: deque = deque(maxlen=self.max_history_size)
+        
+        # Errors waiting to be shown; overflow is dropped during error storms
+        self._pending_dialogs: queue.Queue = queue.Queue(maxsize=32)
+        self._drain_scheduled = False
+        self.dialog_coalesce_ms = 150
+        
+        self._detail_dialog: Optional[tk.Toplevel] = None
+        self._detail_error_info: Optional[ErrorInfo] = None
+        # Error summaries waiting for the detailed dialog, at most one per category
+        self._detail_backlog: deque = deque()
+        
+        # Severity dispatch table, bound once per handler
+        self._severity_dialogs: Dict[ErrorSeverity, Callable[[ErrorInfo], None]] = {
+            ErrorSeverity.INFO: self._show_info_dialog,
+            ErrorSeverity.WARNING: self._show_warning_dialog,
+            ErrorSeverity.ERROR: self._show_detailed_error_dialog,
+            ErrorSeverity.CRITICAL: self._show_critical_error_dialog
+        }
     
     def handle_error(self, 
                     error: Union[Exception, ErrorInfo], 
@@ -124,7 +275,7 @@ class ErrorHandler:
             try:
                 callback(error_info)
             except Exception as e:
-                self.logger.error(f"Error in error callback: {e}")
+                self.logger.error("Error in error callback: %s", e)
         
         return error_info
     
@@ -132,72 +283,59 @@ class ErrorHandler:
                                 exception: Exception, 
                                 context: Optional[Dict[str, Any]] = None) -> ErrorInfo:
         """Convert an exception to ErrorInfo."""
-        category = self._categorize_exception(exception)
-        severity = self._determine_severity(exception, category)
+        # Stringify and lowercase the message once for every classifier step
+        message = str(exception)
+        message_lower = message.lower()
         
-        technical_details = f"{type(exception).__name__}: {str(exception)}"
-        if hasattr(exception, '__traceback__') and exception.__traceback__:
-            technical_details += f"\n\nTraceback:\n{''.join(traceback.format_tb(exception.__traceback__))}"
+        category = self._categorize_exception(exception, message_lower)
+        severity = self._determine_severity(exception, category, message_lower)
         
         suggested_actions = self._generate_suggested_actions(category, exception)
         
+        # Keep a frame-free stack; source lines are read only when formatted
+        stack_summary = None
+        if exception.__traceback__ is not None:
+            stack_summary = traceback.StackSummary.extract(
+                traceback.walk_tb(exception.__traceback__), lookup_lines=False
+            )
+        
         return ErrorInfo(
             category=category,
             severity=severity,
-            message=str(exception),
-            technical_details=technical_details,
+            message=message,
             suggested_actions=suggested_actions,
-            context=context
+            context=context,
+            exception_summary=f"{type(exception).__name__}: {message}",
+            stack_summary=stack_summary
         )
     
-    def _categorize_exception(self, exception: Exception) -> ErrorCategory:
+    def _categorize_exception(self,
+                              exception: Exception,
+                              message_lower: Optional[str] = None) -> ErrorCategory:
         """Categorize an exception based on its type and message."""
-        exception_type = type(exception).__name__
-        exception_message = str(exception).lower()
-        
-        # Network-related errors
-        if any(keyword in exception_type.lower() for keyword in 
-               ['connection', 'timeout', 'network', 'socket', 'http']):
-            return ErrorCategory.NETWORK
-        
-        if any(keyword in exception_message for keyword in 
-               ['connection', 'timeout', 'network', 'unreachable', 'refused']):
-            return ErrorCategory.NETWORK
-        
-        # Configuration errors
-        if any(keyword in exception_message for keyword in 
-               ['config', 'setting', 'environment', 'missing', 'not found']):
-            return ErrorCategory.CONFIGURATION
-        
-        # Authentication errors
-        if any(keyword in exception_message for keyword in 
-               ['auth', 'credential', 'token', 'unauthorized', 'forbidden']):
-            return ErrorCategory.AUTHENTICATION
-        
-        # Validation errors
-        if any(keyword in exception_type.lower() for keyword in 
-               ['value', 'type', 'attribute', 'key']):
-            return ErrorCategory.VALIDATION
-        
-        # UI errors
-        if any(keyword in exception_type.lower() for keyword in 
-               ['tk', 'widget', 'gui', 'display']):
-            return ErrorCategory.UI
-        
-        # Service errors
-        if any(keyword in exception_message for keyword in 
-               ['service', 'server', 'api', 'endpoint']):
-            return ErrorCategory.SERVICE
+        if message_lower is None:
+            message_lower = str(exception).lower()
+        texts = (type(exception).__name__.lower(), message_lower)
+        
+        for target, pattern, category in _CATEGORY_RULES:
+            if pattern.search(texts[target]):
+                return category
         
         return ErrorCategory.UNKNOWN
     
-    def _determine_severity(self, exception: Exception, category: ErrorCategory) -> ErrorSeverity:
+    def _determine_severity(self,
+                            exception: Exception,
+                            category: ErrorCategory,
+                            message_lower: Optional[str] = None) -> ErrorSeverity:
         """Determine error severity based on exception and category."""
         if isinstance(exception, (SystemExit, KeyboardInterrupt)):
             return ErrorSeverity.CRITICAL
         
-        if category == ErrorCategory.CONFIGURATION and "required" in str(exception).lower():
-            return ErrorSeverity.CRITICAL
+        if category == ErrorCategory.CONFIGURATION:
+            if message_lower is None:
+                message_lower = str(exception).lower()
+            if "required" in message_lower:
+                return ErrorSeverity.CRITICAL
         
         if category in [ErrorCategory.NETWORK, ErrorCategory.SERVICE, ErrorCategory.AUTHENTICATION]:
             return ErrorSeverity.ERROR
@@ -209,101 +347,29 @@ class ErrorHandler:
     
     def _generate_suggested_actions(self, category: ErrorCategory, exception: Exception) -> list:
         """Generate suggested actions based on error category."""
-        actions = []
-        
-        if category == ErrorCategory.NETWORK:
-            actions.extend([
-                "Check your internet connection",
-                "Verify the service URL is correct",
-                "Try again in a few moments",
-                "Check if the service is running"
-            ])
-        
-        elif category == ErrorCategory.CONFIGURATION:
-            actions.extend([
-                "Check your .env configuration file",
-                "Verify all required settings are present",
-                "Restart the application",
-                "Check the documentation for configuration requirements"
-            ])
-        
-        elif category == ErrorCategory.SERVICE:
-            actions.extend([
-                "Check if the service is running",
-                "Verify the service endpoint URL",
-                "Try refreshing the service list",
-                "Contact the service administrator"
-            ])
-        
-        elif category == ErrorCategory.AUTHENTICATION:
-            actions.extend([
-                "Check your authentication credentials",
-                "Verify your API key or token",
-                "Check if your credentials have expired",
-                "Contact your administrator for access"
-            ])
-        
-        elif category == ErrorCategory.TIMEOUT:
-            actions.extend([
-                "Try the request again",
-                "Check your network connection",
-                "Increase timeout settings if possible",
-                "Try with a smaller request"
-            ])
-        
-        elif category == ErrorCategory.VALIDATION:
-            actions.extend([
-                "Check your input format",
-                "Verify all required fields are filled",
-                "Check for special characters or invalid data",
-                "Refer to the API documentation"
-            ])
-        
-        elif category == ErrorCategory.UI:
-            actions.extend([
-                "Try refreshing the interface",
-                "Restart the application",
-                "Check if your display settings are correct",
-                "Report this issue if it persists"
-            ])
-        
-        else:
-            actions.extend([
-                "Try the operation again",
-                "Restart the application if the problem persists",
-                "Check the application logs for more details",
-                "Contact support if the issue continues"
-            ])
-        
-        return actions
+        return list(_SUGGESTED_ACTIONS.get(category, _DEFAULT_SUGGESTED_ACTIONS))
     
     def _log_error(self, error_info: ErrorInfo):
         """Log error information."""
-        context_str = ""
-        if error_info.context:
-            context_items = [f"{k}={v}" for k, v in error_info.context.items()]
-            context_str = f" | Context: {', '.join(context_items)}"
-        
-        log_message = f"[{error_info.category.value.upper()}] {error_info.message}{context_str}"
-        
-        if error_info.severity == ErrorSeverity.CRITICAL:
-            self.logger.critical(log_message)
-        elif error_info.severity == ErrorSeverity.ERROR:
-            self.logger.error(log_message)
-        elif error_info.severity == ErrorSeverity.WARNING:
-            self.logger.warning(log_message)
-        else:
-            self.logger.info(log_message)
+        level = _SEVERITY_LOG_LEVELS.get(error_info.severity, logging.INFO)
+        if self.logger.isEnabledFor(level):
+            context_str = ""
+            if error_info.context:
+                context_items = [f"{k}={v}" for k, v in error_info.context.items()]
+                context_str = f" | Context: {', '.join(context_items)}"
+            
+            self.logger.log(level, "[%s] %s%s", error_info.category.value.upper(),
+                            error_info.message, context_str)
         
-        if error_info.technical_details:
-            self.logger.debug(f"Technical details: {error_info.technical_details}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            technical_details = error_info.get_technical_details()
+            if technical_details:
+                self.logger.debug("Technical details: %s", technical_details)
     
     def _add_to_history(self, error_info: ErrorInfo):
         """Add error to history."""
+        # Bounded deque drops the oldest entry on overflow
         self.error_history.append(error_info)
-        
-        if len(self.error_history) > self.max_history_size:
-            self.error_history = self.error_history[-self.max_history_size:]
     
     def _show_error_dialog(self, error_info: ErrorInfo):
         """Show appropriate error dialog to user."""
@@ -311,101 +377,253 @@ class ErrorHandler:
             return
         
         try:
-            if error_info.severity == ErrorSeverity.INFO:
-                messagebox.showinfo(
-                    "Information",
-                    error_info.user_message,
-                    parent=self.parent_window
-                )
-            
-            elif error_info.severity == ErrorSeverity.WARNING:
-                messagebox.showwarning(
-                    "Warning",
-                    error_info.user_message,
-                    parent=self.parent_window
-                )
+            self._pending_dialogs.put_nowait(error_info)
+        except queue.Full:
+            return
+        
+        self._schedule_dialog_drain()
+    
+    def _schedule_dialog_drain(self):
+        """Schedule a single pass that shows the queued error dialogs."""
+        if self._drain_scheduled:
+            return
+        
+        try:
+            self.parent_window.after(self.dialog_coalesce_ms, self._drain_dialogs)
+            self._drain_scheduled = True
+        except Exception as e:
+            self.logger.error("Error scheduling error dialog: %s", e)
+    
+    def _drain_dialogs(self):
+        """Show one summary dialog per category for the errors queued since the last pass."""
+        pending = []
+        while True:
+            try:
+                pending.append(self._pending_dialogs.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            by_category: Dict[ErrorCategory, List[ErrorInfo]] = {}
+            for info in pending:
+                by_category.setdefault(info.category, []).append(info)
             
-            elif error_info.severity == ErrorSeverity.ERROR:
-                self._show_detailed_error_dialog(error_info)
+            # For each category show its most severe error with a count of
+            # the others; the most severe categories are shown first
+            summaries = []
+            for infos in by_category.values():
+                error_info = max(infos, key=_severity_rank)
+                if len(infos) > 1:
+                    error_info = replace(
+                        error_info,
+                        user_message=f"{error_info.user_message}\n\n"
+                                     f"{len(infos) - 1} similar error(s) also occurred."
+                    )
+                summaries.append(error_info)
             
-            elif error_info.severity == ErrorSeverity.CRITICAL:
-                messagebox.showerror(
-                    "Critical Error",
-                    f"{error_info.user_message}\n\nThe application may need to be restarted.",
-                    parent=self.parent_window
-                )
+            summaries.sort(key=_severity_rank, reverse=True)
+            for error_info in summaries:
+                self._display_error_dialog(error_info)
+        finally:
+            self._drain_scheduled = False
+            if not self._pending_dialogs.empty():
+                self._schedule_dialog_drain()
+    
+    def _display_error_dialog(self, error_info: ErrorInfo):
+        """Show the dialog matching the error severity."""
+        show_dialog = self._severity_dialogs.get(error_info.severity)
+        if show_dialog is None:
+            return
         
+        try:
+            show_dialog(error_info)
         except Exception as e:
-            self.logger.error(f"Error showing error dialog: {e}")
+            self.logger.error("Error showing error dialog: %s", e)
+    
+    def _show_info_dialog(self, error_info: ErrorInfo):
+        """Show informational message dialog."""
+        messagebox.showinfo(
+            "Information",
+            error_info.user_message,
+            parent=self.parent_window
+        )
+    
+    def _show_warning_dialog(self, error_info: ErrorInfo):
+        """Show warning message dialog."""
+        messagebox.showwarning(
+            "Warning",
+            error_info.user_message,
+            parent=self.parent_window
+        )
+    
+    def _show_critical_error_dialog(self, error_info: ErrorInfo):
+        """Show critical error message dialog."""
+        messagebox.showerror(
+            "Critical Error",
+            f"{error_info.user_message}\n\nThe application may need to be restarted.",
+            parent=self.parent_window
+        )
     
     def _show_detailed_error_dialog(self, error_info: ErrorInfo):
-        """Show detailed error dialog with options."""
+        """
+        Show detailed error dialog with options.
+        
+        The dialog is shared, so while it is open further errors wait and are
+        shown in turn as the user closes it.
+        """
+        if self._detail_error_info is not None:
+            if all(info.category != error_info.category for info in self._detail_backlog):
+                self._detail_backlog.append(error_info)
+            return
+        
+        self._render_detailed_error_dialog(error_info)
+    
+    def _render_detailed_error_dialog(self, error_info: ErrorInfo):
+        """Populate and show the reusable detailed error dialog."""
         try:
-            # Create custom dialog
-            dialog = tk.Toplevel(self.parent_window)
-            dialog.title("Error Details")
-            dialog.geometry("500x400")
-            dialog.resizable(True, True)
-            
-            dialog.transient(self.parent_window)
-            dialog.grab_set()
+            # The dialog is built once and re-populated for each error
+            if self._detail_dialog is None or not self._detail_dialog.winfo_exists():
+                self._build_detailed_error_dialog()
             
-            # Main frame
-            main_frame = tk.Frame(dialog, padx=20, pady=20)
-            main_frame.pack(fill=tk.BOTH, expand=True)
+            dialog = self._detail_dialog
+            self._detail_error_info = error_info
             
-            # Error message
-            message_label = tk.Label(
-                main_frame,
-                text=error_info.user_message,
-                font=('Segoe UI', 10, 'bold'),
-                wraplength=450,
-                justify=tk.LEFT
-            )
-            message_label.pack(anchor=tk.W, pady=(0, 10))
+            self._detail_message_label.configure(text=error_info.user_message)
             
             # Suggested actions
+            self._detail_actions_label.pack_forget()
+            for action_label in self._detail_action_labels:
+                action_label.pack_forget()
+            
             if error_info.suggested_actions:
-                actions_label = tk.Label(
-                    main_frame,
-                    text="Suggested actions:",
-                    font=('Segoe UI', 9, 'bold')
+                self._detail_actions_label.pack(
+                    anchor=tk.W, pady=(10, 5), before=self._detail_button_frame
                 )
-                actions_label.pack(anchor=tk.W, pady=(10, 5))
                 
-                for action in error_info.suggested_actions[:4]:
-                    action_label = tk.Label(
-                        main_frame,
-                        text=f"• {action}",
-                        font=('Segoe UI', 9),
-                        wraplength=450,
-                        justify=tk.LEFT
-                    )
-                    action_label.pack(anchor=tk.W, padx=(10, 0))
+                for action_label, action in zip(self._detail_action_labels,
+                                                error_info.suggested_actions):
+                    action_label.configure(text=f"• {action}")
+                    action_label.pack(anchor=tk.W, padx=(10, 0), before=self._detail_button_frame)
             
-            # Button frame
-            button_frame = tk.Frame(main_frame)
-            button_frame.pack(fill=tk.X, pady=(20, 0))
+            # Technical details are only formatted when the user asks for them
+            details_text = self._detail_details_text
+            details_text.pack_forget()
+            details_text.configure(state=tk.NORMAL)
+            details_text.delete('1.0', tk.END)
+            details_text.configure(state=tk.DISABLED)
             
-            # Close button
-            close_button = tk.Button(
-                button_frame,
-                text="Close",
-                command=dialog.destroy
-            )
-            close_button.pack(side=tk.RIGHT)
-            close_button.focus_set()
+            if error_info.has_technical_details():
+                self._detail_details_button.pack(side=tk.LEFT)
+            else:
+                self._detail_details_button.pack_forget()
             
-            dialog.protocol("WM_DELETE_WINDOW", dialog.destroy)
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            self._detail_close_button.focus_set()
             
         except Exception as e:
-            self.logger.error(f"Error creating detailed error dialog: {e}")
+            self.logger.error("Error creating detailed error dialog: %s", e)
+            self._detail_error_info = None
             messagebox.showerror(
                 "Error",
                 error_info.user_message,
                 parent=self.parent_window
             )
     
+    def _build_detailed_error_dialog(self):
+        """Create the reusable detailed error dialog widgets (initially hidden)."""
+        # Create custom dialog
+        dialog = tk.Toplevel(self.parent_window)
+        dialog.withdraw()
+        dialog.title("Error Details")
+        dialog.geometry("500x400")
+        dialog.resizable(True, True)
+        
+        dialog.transient(self.parent_window)
+        
+        # Main frame
+        main_frame = tk.Frame(dialog, padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Error message
+        self._detail_message_label = tk.Label(
+            main_frame,
+            font=('Segoe UI', 10, 'bold'),
+            wraplength=450,
+            justify=tk.LEFT
+        )
+        self._detail_message_label.pack(anchor=tk.W, pady=(0, 10))
+        
+        # Suggested actions, packed per error
+        self._detail_actions_label = tk.Label(
+            main_frame,
+            text="Suggested actions:",
+            font=('Segoe UI', 9, 'bold')
+        )
+        self._detail_action_labels = [
+            tk.Label(
+                main_frame,
+                font=('Segoe UI', 9),
+                wraplength=450,
+                justify=tk.LEFT
+            )
+            for _ in range(4)
+        ]
+        
+        # Button frame
+        self._detail_button_frame = tk.Frame(main_frame)
+        self._detail_button_frame.pack(fill=tk.X, pady=(20, 0))
+        
+        self._detail_details_text = tk.Text(
+            main_frame,
+            height=10,
+            wrap=tk.NONE,
+            font=('Consolas', 9),
+            state=tk.DISABLED
+        )
+        
+        self._detail_details_button = tk.Button(
+            self._detail_button_frame,
+            text="Details",
+            command=self._toggle_error_details
+        )
+        
+        # Close button
+        self._detail_close_button = tk.Button(
+            self._detail_button_frame,
+            text="Close",
+            command=self._hide_detailed_error_dialog
+        )
+        self._detail_close_button.pack(side=tk.RIGHT)
+        
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_detailed_error_dialog)
+        self._detail_dialog = dialog
+    
+    def _toggle_error_details(self):
+        """Show or hide the technical details of the displayed error."""
+        details_text = self._detail_details_text
+        if details_text.winfo_ismapped():
+            details_text.pack_forget()
+            return
+        
+        if details_text.compare('end-1c', '==', '1.0') and self._detail_error_info:
+            details_text.configure(state=tk.NORMAL)
+            details_text.insert('1.0', self._detail_error_info.get_technical_details() or "")
+            details_text.configure(state=tk.DISABLED)
+        
+        details_text.pack(fill=tk.BOTH, expand=True, pady=(10, 0), before=self._detail_button_frame)
+    
+    def _hide_detailed_error_dialog(self):
+        """Hide the detailed error dialog and show the next waiting error, if any."""
+        if self._detail_dialog is not None:
+            self._detail_dialog.grab_release()
+            self._detail_dialog.withdraw()
+        self._detail_error_info = None
+        
+        if self._detail_backlog:
+            self._show_detailed_error_dialog(self._detail_backlog.popleft())
+    
     def _execute_callbacks(self, error_info: ErrorInfo):
         """Execute registered callbacks for error category."""
         callbacks = self.error_callbacks.get(error_info.category, [])
@@ -414,7 +632,7 @@ class ErrorHandler:
             try:
                 callback(error_info)
             except Exception as e:
-                self.logger.error(f"Error in error callback: {e}")
+                self.logger.error("Error in error callback: %s", e)
     
     def register_error_callback(self, category: ErrorCategory, callback: Callable):
         """Register a callback for specific error categories."""
@@ -427,7 +645,7 @@ class ErrorHandler:
         """Get error history, optionally filtered by category."""
         if category:
             return [error for error in self.error_history if error.category == category]
-        return self.error_history.copy()
+        return list(self.error_history)
     
     def clear_error_history(self):
         """Clear error history."""
@@ -2,12 +2,15 @@
 Logging system for MCP Dashboard application.
 Provides structured logging with different levels and output formats.
 """
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
 import os
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
 
@@ -21,6 +24,62 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps exception info for the listener's formatters."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge message arguments before the record crosses threads.
+        
+        Args:
+            record: Record emitted on the caller's thread
+            
+        Returns:
+            Copy of the record safe to format on the listener thread
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _SizeTrackingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that tracks the written size in memory.
+    
+    The stock handler queries the open file's position for every record;
+    this one reads it once when the file is opened and then advances it by
+    the encoded size of each record written.
+    """
+    
+    _size = 0
+    _pending = 0
+    
+    def _open(self):
+        # The log directory is created on first write rather than at startup
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        stream = super()._open()
+        self._size = stream.seek(0, os.SEEK_END)
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.maxBytes <= 0:
+            return False
+        
+        if self.stream is None:
+            self.stream = self._open()
+        
+        # Track the encoded size so non-ASCII text cannot overrun maxBytes
+        text = self.format(record) + self.terminator
+        self._pending = len(text.encode(self.stream.encoding, self.stream.errors or 'strict'))
+        return self._size + self._pending >= self.maxBytes
+    
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        self._size += self._pending
+        self._pending = 0
+
+
 class MCPDashboardLogger:
     """
     Centralized logging system for MCP Dashboard.
@@ -56,8 +115,6 @@ class MCPDashboardLogger:
         else:
             self.log_directory = Path(__file__).parent.parent / "logs"
         
-        self.log_directory.mkdir(exist_ok=True)
-        
         # Initialize logger
         self.logger = logging.getLogger(name)
         self.logger.setLevel(log_level.value)
@@ -65,14 +122,23 @@ class MCPDashboardLogger:
         # Clear existing handlers to avoid duplicates
         self.logger.handlers.clear()
         
+        self._console_handler: Optional[logging.Handler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        
         # Set up handlers
         self._setup_handlers()
         
         # Log startup
-        self.logger.info(f"Logging system initialized - Level: {log_level.name}")
+        self.logger.info("Logging system initialized - Level: %s", log_level.name)
     
     def _setup_handlers(self):
-        """Set up logging handlers for file and console output."""
+        """Set up logging handlers for file and console output.
+        
+        The real handlers are owned by a background queue listener so
+        callers only pay for an enqueue, never for disk or console I/O.
+        """
+        handlers = []
+        
         # Console handler
         if self.log_to_console:
             console_handler = logging.StreamHandler(sys.stdout)
@@ -82,17 +148,19 @@ class MCPDashboardLogger:
                 datefmt='%H:%M:%S'
             )
             console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
+            self._console_handler = console_handler
+            handlers.append(console_handler)
         
         # File handler with rotation
         if self.log_to_file:
             log_file = self.log_directory / f"{self.name.lower()}.log"
             
             # Use rotating file handler to prevent huge log files
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = _SizeTrackingRotatingFileHandler(
                 log_file,
                 maxBytes=10 * 1024 * 1024,  # 10MB
-                backupCount=5
+                backupCount=5,
+                delay=True
             )
             file_handler.setLevel(logging.DEBUG)  # File gets all levels
             
@@ -101,15 +169,26 @@ class MCPDashboardLogger:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+            
+            # Buffer routine records and write them in batches; errors flush
+            # the buffer immediately so nothing important sits in memory
+            buffered_file_handler = logging.handlers.MemoryHandler(
+                capacity=512,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True
+            )
+            buffered_file_handler.setLevel(logging.DEBUG)
+            handlers.append(buffered_file_handler)
         
-        # Error file handler for errors and above
+        # Error file handler for errors and above, opened on the first error
         if self.log_to_file:
             error_log_file = self.log_directory / f"{self.name.lower()}_errors.log"
-            error_handler = logging.handlers.RotatingFileHandler(
+            error_handler = _SizeTrackingRotatingFileHandler(
                 error_log_file,
                 maxBytes=5 * 1024 * 1024,  # 5MB
-                backupCount=3
+                backupCount=3,
+                delay=True
             )
             error_handler.setLevel(logging.ERROR)
             
@@ -119,7 +198,31 @@ class MCPDashboardLogger:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             error_handler.setFormatter(error_formatter)
-            self.logger.addHandler(error_handler)
+            handlers.append(error_handler)
+        
+        if not handlers:
+            return
+        
+        self._log_queue: queue.Queue = queue.Queue(-1)
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *handlers, respect_handler_level=True
+        )
+        self.logger.addHandler(_RecordQueueHandler(self._log_queue))
+        self._listener.start()
+        atexit.register(self.shutdown)
+    
+    def shutdown(self):
+        """Flush pending records and stop the background log listener."""
+        if self._listener is None:
+            return
+        
+        listener, self._listener = self._listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
     
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """
@@ -150,14 +253,16 @@ class MCPDashboardLogger:
             logger_name: Optional specific logger name
         """
         logger = self.get_logger(logger_name)
+        if not logger.isEnabledFor(logging.ERROR):
+            return
         
         context_str = ""
         if context:
             context_items = [f"{k}={v}" for k, v in context.items()]
             context_str = f" | Context: {', '.join(context_items)}"
         
-        logger.error(f"{message} | Exception: {type(exception).__name__}: {str(exception)}{context_str}", 
-                    exc_info=True)
+        logger.error("%s | Exception: %s: %s%s", message, type(exception).__name__, exception,
+                     context_str, exc_info=True)
     
     def log_request(self, 
                    method: str, 
@@ -178,13 +283,14 @@ class MCPDashboardLogger:
         logger = self.get_logger("HttpClient")
         
         if error:
-            logger.warning(f"{method} {url} - FAILED: {error}")
+            logger.warning("%s %s - FAILED: %s", method, url, error)
         elif status_code:
             level = logging.INFO if status_code < 400 else logging.WARNING
-            time_str = f" ({response_time:.1f}ms)" if response_time else ""
-            logger.log(level, f"{method} {url} - {status_code}{time_str}")
+            if logger.isEnabledFor(level):
+                time_str = f" ({response_time:.1f}ms)" if response_time else ""
+                logger.log(level, "%s %s - %s%s", method, url, status_code, time_str)
         else:
-            logger.debug(f"{method} {url} - Request initiated")
+            logger.debug("%s %s - Request initiated", method, url)
     
     def log_health_check(self, 
                         service_name: str, 
@@ -203,10 +309,10 @@ class MCPDashboardLogger:
         logger = self.get_logger("HealthChecker")
         
         if error:
-            logger.warning(f"Health check FAILED for {service_name}: {error}")
-        else:
+            logger.warning("Health check FAILED for %s: %s", service_name, error)
+        elif logger.isEnabledFor(logging.INFO):
             time_str = f" ({response_time:.1f}ms)" if response_time else ""
-            logger.info(f"Health check for {service_name}: {status}{time_str}")
+            logger.info("Health check for %s: %s%s", service_name, status, time_str)
     
     def log_user_action(self, action: str, details: Optional[str] = None):
         """
@@ -218,11 +324,10 @@ class MCPDashboardLogger:
         """
         logger = self.get_logger("UserActions")
         
-        message = f"User action: {action}"
         if details:
-            message += f" | Details: {details}"
-        
-        logger.info(message)
+            logger.info("User action: %s | Details: %s", action, details)
+        else:
+            logger.info("User action: %s", action)
     
     def set_log_level(self, level: LogLevel):
         """
@@ -234,12 +339,13 @@ class MCPDashboardLogger:
         self.log_level = level
         self.logger.setLevel(level.value)
         
-        # Update console handler level
-        for handler in self.logger.handlers:
-            if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-                handler.setLevel(level.value)
+        # Update console handler level once already queued records are written
+        if self._console_handler is not None:
+            if self._listener is not None:
+                self._log_queue.join()
+            self._console_handler.setLevel(level.value)
         
-        self.logger.info(f"Log level changed to {level.name}")
+        self.logger.info("Log level changed to %s", level.name)
     
     def get_log_files(self) -> Dict[str, Path]:
         """
@@ -261,15 +367,28 @@ class MCPDashboardLogger:
             days_to_keep: Number of days of logs to keep
         """
         try:
-            cutoff_time = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
+            cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
+            
+            # DirEntry caches stat results from the directory scan; unlink after
+            # iterating so the directory is not modified mid-scan
+            with os.scandir(self.log_directory) as entries:
+                expired = [
+                    entry for entry in entries
+                    if ".log" in entry.name
+                    and entry.is_file()
+                    and entry.stat().st_mtime < cutoff_time
+                ]
             
-            for log_file in self.log_directory.glob("*.log*"):
-                if log_file.stat().st_mtime < cutoff_time:
-                    log_file.unlink()
-                    self.logger.info(f"Cleaned up old log file: {log_file.name}")
+            for entry in expired:
+                os.unlink(entry.path)
+                self.logger.info("Cleaned up old log file: %s", entry.name)
+        
+        except FileNotFoundError:
+            # Nothing has been logged to disk yet
+            return
         
         except Exception as e:
-            self.logger.error(f"Error cleaning up old logs: {e}")
+            self.logger.error("Error cleaning up old logs: %s", e)
 
 
 # Global logger instance
@@ -312,6 +431,9 @@ def initialize_logging(log_level: LogLevel = LogLevel.INFO,
     """
     global _global_logger
     
+    if _global_logger is not None:
+        _global_logger.shutdown()
+    
     _global_logger = MCPDashboardLogger(
         log_level=log_level,
         log_to_file=log_to_file,
@@ -8,28 +8,174 @@ dependencies, and configuration before the application starts.
 
 import sys
 import os
-import importlib
-import platform
-import tkinter as tk
+import importlib.util
+import io
+import json
+import stat
+import tempfile
+import time
+import zlib
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable, FrozenSet, Sequence, TextIO, TYPE_CHECKING
 import logging
 
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+# Checks whose outcome only depends on the interpreter, installed packages and
+# display; passing results are cached on disk for a short time between runs
+_CACHEABLE_CHECKS = frozenset({"Python Version", "Required Modules", "Tkinter GUI"})
+_CACHE_TTL_SECONDS = 300
+
+# The cache lives in the shared temp dir, so it is named per user and only
+# trusted when it is a regular file owned by the current user
+_CACHE_UID = os.getuid() if hasattr(os, "getuid") else None
+_CACHE_PATH = Path(tempfile.gettempdir()) / (
+    f"mcp_dashboard_validation_{'' if _CACHE_UID is None else f'{_CACHE_UID}_'}"
+    f"{zlib.crc32(sys.executable.encode()):08x}.json"
+)
+
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Configuration files in order of preference
+_CONFIG_PATHS: Tuple[Path, ...] = (
+    _PROJECT_ROOT.parent / ".env.mcp-gateway.example",
+    _PROJECT_ROOT / ".env.mcp-gateway.example",
+    _PROJECT_ROOT.parent / ".env",
+    _PROJECT_ROOT / ".env"
+)
+
+# Validation checks in run order: (check name, validator method, is critical)
+_VALIDATIONS: Tuple[Tuple[str, str, bool], ...] = (
+    ("Python Version", "validate_python_version", True),
+    ("Required Modules", "validate_required_modules", True),
+    ("Tkinter GUI", "validate_tkinter_availability", True),
+    ("System Resources", "validate_system_resources", False),
+    ("Configuration", "validate_configuration_files", False),
+    ("Network Connectivity", "validate_network_connectivity", False),
+    ("File Permissions", "validate_permissions", True),
+)
+
+# Checks that must run on the calling thread (Tk is not thread-safe)
+_MAIN_THREAD_CHECKS = frozenset({"Tkinter GUI"})
+
+_EMPTY_ACTIONS: Tuple[str, ...] = ()
+
+_REQUIRED_MODULES: Tuple[Tuple[str, str], ...] = (
+    ("tkinter", "GUI framework"),
+    ("requests", "HTTP client library"),
+    ("dotenv", "Environment configuration"),
+    ("aiohttp", "Async HTTP client"),
+    ("asyncio", "Async programming support")
+)
+
+# Constant suggested actions shared by every result that uses them
+_MISSING_MODULE_ACTIONS = (
+    "Run: pip install -r requirements.txt",
+    "Check your Python environment and PATH",
+    "Verify pip is working correctly",
+    "Consider using a virtual environment"
+)
+
+_TKINTER_MISSING_ACTIONS = (
+    "On Ubuntu/Debian: sudo apt-get install python3-tk",
+    "On CentOS/RHEL: sudo yum install tkinter",
+    "On macOS: Tkinter should be included with Python",
+    "On Windows: Tkinter should be included with Python",
+    "Reinstall Python with GUI support enabled"
+)
+
+_TKINTER_DISPLAY_ACTIONS = (
+    "Check display settings (DISPLAY variable on Linux)",
+    "Ensure X11 forwarding is enabled for remote connections",
+    "Verify GUI environment is available",
+    "Try running on a system with desktop environment"
+)
+
+_LOW_RESOURCES_ACTIONS = (
+    "Free up system memory by closing other applications",
+    "Clean up disk space",
+    "Monitor system performance during application use"
+)
+
+_INVALID_CONFIG_ACTIONS = (
+    "Check configuration file syntax",
+    "Verify file is not corrupted",
+    "Review configuration file format in README",
+    "Create a new configuration file from template"
+)
+
+_MISSING_CONFIG_ACTIONS = (
+    "Create .env.mcp-gateway.example in parent directory",
+    "Copy configuration template from documentation",
+    "Set environment variables manually if needed",
+    "Application will use default settings"
+)
+
+_NETWORK_ACTIONS = (
+    "Check network configuration",
+    "Verify localhost resolution",
+    "Check firewall settings",
+    "Ensure network stack is functional"
+)
+
+_PERMISSION_ACTIONS = (
+    "Check file and directory permissions",
+    "Run application with appropriate user privileges",
+    "Verify application directory is not read-only",
+    "Check disk space and file system health"
+)
+
+_CHECK_ERROR_ACTIONS = (
+    "Check application logs for details",
+    "Report this issue"
+)
+
+# Status prefix for ValidationResult.__str__, indexed by success
+_PREFIX = ("✗ ", "✓ ")
+
 
 class ValidationResult:
     """Represents the result of a validation check."""
     
+    __slots__ = ("success", "message", "details", "suggested_actions")
+    
     def __init__(self, success: bool, message: str, details: Optional[str] = None, 
-                 suggested_actions: Optional[List[str]] = None):
+                 suggested_actions: Optional[Sequence[str]] = None):
         self.success = success
         self.message = message
-        self.details = details or ""
-        self.suggested_actions = suggested_actions or []
+        self.details = details if details else ""
+        # Results without actions share one empty tuple
+        self.suggested_actions = suggested_actions if suggested_actions else _EMPTY_ACTIONS
     
     def __str__(self):
-        return f"{'✓' if self.success else '✗'} {self.message}"
+        return _PREFIX[self.success] + self.message
+    
+    def __repr__(self):
+        return f"ValidationResult(success={self.success!r}, message={self.message!r})"
+    
+    def to_dict(self) -> Dict[str, object]:
+        """Convert the result to a JSON-serializable dictionary."""
+        return {
+            "success": self.success,
+            "message": self.message,
+            "details": self.details,
+            "suggested_actions": list(self.suggested_actions)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> 'ValidationResult':
+        """Create a result from a dictionary produced by to_dict()."""
+        return cls(
+            success=bool(data["success"]),
+            message=str(data["message"]),
+            details=data.get("details") or None,
+            suggested_actions=tuple(data.get("suggested_actions") or ())
+        )
 
 
 class StartupValidator:
@@ -40,50 +186,51 @@ class StartupValidator:
         self.validation_results: List[ValidationResult] = []
         self.critical_failures: List[ValidationResult] = []
         self.warnings: List[ValidationResult] = []
+        self._completed = False
+        self._log_buffer: List[Tuple[int, str, Tuple[object, ...]]] = []
     
     def validate_python_version(self) -> ValidationResult:
         """Validate Python version meets minimum requirements."""
         min_version = (3, 8)
         current_version = sys.version_info[:2]
+        current_str = f"{current_version[0]}.{current_version[1]}"
         
         if current_version >= min_version:
             return ValidationResult(
                 success=True,
-                message=f"Python version {'.'.join(map(str, current_version))} meets requirements"
+                message=f"Python version {current_str} meets requirements"
             )
         else:
+            min_str = f"{min_version[0]}.{min_version[1]}"
             return ValidationResult(
                 success=False,
-                message=f"Python version {'.'.join(map(str, current_version))} is below minimum required {'.'.join(map(str, min_version))}",
-                suggested_actions=[
-                    f"Upgrade Python to version {'.'.join(map(str, min_version))} or higher",
+                message=f"Python version {current_str} is below minimum required {min_str}",
+                suggested_actions=(
+                    f"Upgrade Python to version {min_str} or higher",
                     "Check your Python installation",
                     "Consider using pyenv or conda to manage Python versions"
-                ]
+                )
             )
     
     def validate_required_modules(self) -> ValidationResult:
         """Validate that all required Python modules are available."""
-        required_modules = [
-            ("tkinter", "GUI framework"),
-            ("requests", "HTTP client library"),
-            ("dotenv", "Environment configuration"),
-            ("aiohttp", "Async HTTP client"),
-            ("asyncio", "Async programming support")
-        ]
-        
         missing_modules = []
         available_modules = []
         
-        for module_name, description in required_modules:
-            try:
-                # Handle special cases
-                if module_name == "dotenv":
-                    importlib.import_module("dotenv")
-                else:
-                    importlib.import_module(module_name)
+        for module_name, description in _REQUIRED_MODULES:
+            # Already imported modules need no lookup; otherwise locate the
+            # module without executing it
+            if module_name in sys.modules:
+                available = True
+            else:
+                try:
+                    available = importlib.util.find_spec(module_name) is not None
+                except (ImportError, ValueError):
+                    available = False
+            
+            if available:
                 available_modules.append(f"{module_name} ({description})")
-            except ImportError:
+            else:
                 missing_modules.append((module_name, description))
         
         if not missing_modules:
@@ -97,12 +244,7 @@ class StartupValidator:
                 success=False,
                 message=f"Missing required modules: {', '.join(missing_names)}",
                 details=f"Missing modules: {', '.join([f'{name} ({desc})' for name, desc in missing_modules])}",
-                suggested_actions=[
-                    "Run: pip install -r requirements.txt",
-                    "Check your Python environment and PATH",
-                    "Verify pip is working correctly",
-                    "Consider using a virtual environment"
-                ]
+                suggested_actions=_MISSING_MODULE_ACTIONS
             )
     
     def validate_tkinter_availability(self) -> ValidationResult:
@@ -111,6 +253,13 @@ class StartupValidator:
             # Try to import tkinter
             import tkinter as tk
             
+            # Without a display server the window probe can only fail, and
+            # may first wait on an X11 connection attempt
+            if (sys.platform.startswith("linux")
+                    and not os.environ.get("DISPLAY")
+                    and not os.environ.get("WAYLAND_DISPLAY")):
+                raise tk.TclError("no display name and no $DISPLAY environment variable")
+            
             # Try to create a test root window (but don't show it)
             test_root = tk.Tk()
             test_root.withdraw()  # Hide the window
@@ -125,47 +274,52 @@ class StartupValidator:
                 success=False,
                 message="Tkinter GUI framework is not available",
                 details="Tkinter is required for the graphical user interface",
-                suggested_actions=[
-                    "On Ubuntu/Debian: sudo apt-get install python3-tk",
-                    "On CentOS/RHEL: sudo yum install tkinter",
-                    "On macOS: Tkinter should be included with Python",
-                    "On Windows: Tkinter should be included with Python",
-                    "Reinstall Python with GUI support enabled"
-                ]
+                suggested_actions=_TKINTER_MISSING_ACTIONS
             )
         except Exception as e:
             return ValidationResult(
                 success=False,
                 message="Tkinter is available but cannot create windows",
                 details=f"Error: {str(e)}",
-                suggested_actions=[
-                    "Check display settings (DISPLAY variable on Linux)",
-                    "Ensure X11 forwarding is enabled for remote connections",
-                    "Verify GUI environment is available",
-                    "Try running on a system with desktop environment"
-                ]
+                suggested_actions=_TKINTER_DISPLAY_ACTIONS
             )
     
     def validate_system_resources(self) -> ValidationResult:
         """Validate system has adequate resources."""
         warnings = []
         
-        # Check available memory (basic check)
+        # Check available memory (basic check), reading the kernel's figure
+        # directly on Linux instead of loading psutil
+        available_mb = None
         try:
-            import psutil
-            memory = psutil.virtual_memory()
-            available_mb = memory.available / (1024 * 1024)
-            
-            if available_mb < 100:  # Less than 100MB available
-                warnings.append(f"Low available memory: {available_mb:.0f}MB")
-        except ImportError:
-            # psutil not available, skip memory check
+            with open("/proc/meminfo", encoding="ascii") as meminfo:
+                for line in meminfo:
+                    if line.startswith("MemAvailable:"):
+                        available_mb = int(line.split()[1]) / 1024  # kB -> MB
+                        break
+        except (OSError, ValueError, IndexError):
             pass
         
+        if available_mb is None:
+            try:
+                import psutil
+                memory = psutil.virtual_memory()
+                available_mb = memory.available / (1024 * 1024)
+            except ImportError:
+                # psutil not available, skip memory check
+                pass
+        
+        if available_mb is not None and available_mb < 100:  # Less than 100MB available
+            warnings.append(f"Low available memory: {available_mb:.0f}MB")
+        
         # Check disk space for logs and temp files
         try:
-            import shutil
-            free_space = shutil.disk_usage('.').free / (1024 * 1024)  # MB
+            if hasattr(os, "statvfs"):
+                vfs = os.statvfs('.')
+                free_space = vfs.f_bavail * vfs.f_frsize / (1024 * 1024)  # MB
+            else:
+                import shutil
+                free_space = shutil.disk_usage('.').free / (1024 * 1024)  # MB
             
             if free_space < 50:  # Less than 50MB free
                 warnings.append(f"Low disk space: {free_space:.0f}MB available")
@@ -177,11 +331,7 @@ class StartupValidator:
                 success=True,  # Not critical, just warnings
                 message="System resources check completed with warnings",
                 details="; ".join(warnings),
-                suggested_actions=[
-                    "Free up system memory by closing other applications",
-                    "Clean up disk space",
-                    "Monitor system performance during application use"
-                ]
+                suggested_actions=_LOW_RESOURCES_ACTIONS
             )
         else:
             return ValidationResult(
@@ -191,19 +341,19 @@ class StartupValidator:
     
     def validate_configuration_files(self) -> ValidationResult:
         """Validate configuration file availability and format."""
-        project_root = Path(__file__).parent.parent
-        
-        # Look for configuration files in order of preference
-        config_paths = [
-            project_root.parent / ".env.mcp-gateway.example",
-            project_root / ".env.mcp-gateway.example",
-            project_root.parent / ".env",
-            project_root / ".env"
-        ]
-        
+        # List each candidate directory once and check names in memory
+        directory_entries: Dict[Path, set] = {}
         found_config = None
-        for config_path in config_paths:
-            if config_path.exists():
+        for config_path in _CONFIG_PATHS:
+            parent = config_path.parent
+            if parent not in directory_entries:
+                try:
+                    with os.scandir(parent) as entries:
+                        directory_entries[parent] = {entry.name for entry in entries}
+                except OSError:
+                    directory_entries[parent] = set()
+            
+            if config_path.name in directory_entries[parent]:
                 found_config = config_path
                 break
         
@@ -223,24 +373,14 @@ class StartupValidator:
                     success=False,
                     message=f"Configuration file found but invalid: {found_config.name}",
                     details=f"Error: {str(e)}",
-                    suggested_actions=[
-                        "Check configuration file syntax",
-                        "Verify file is not corrupted",
-                        "Review configuration file format in README",
-                        "Create a new configuration file from template"
-                    ]
+                    suggested_actions=_INVALID_CONFIG_ACTIONS
                 )
         else:
             return ValidationResult(
                 success=True,  # Not critical - app can run with defaults
                 message="No configuration file found - will use default settings",
-                details=f"Searched paths: {', '.join([str(p) for p in config_paths])}",
-                suggested_actions=[
-                    "Create .env.mcp-gateway.example in parent directory",
-                    "Copy configuration template from documentation",
-                    "Set environment variables manually if needed",
-                    "Application will use default settings"
-                ]
+                details=f"Searched paths: {', '.join([str(p) for p in _CONFIG_PATHS])}",
+                suggested_actions=_MISSING_CONFIG_ACTIONS
             )
     
     def validate_network_connectivity(self) -> ValidationResult:
@@ -248,12 +388,11 @@ class StartupValidator:
         try:
             import socket
             
-            # Try to resolve localhost
-            socket.gethostbyname('localhost')
-            
-            # Try to create a socket (basic network stack check)
-            test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            test_socket.close()
+            # Bind an ephemeral port on the loopback address (basic network
+            # stack check); resolving 'localhost' is avoided because a
+            # misconfigured resolver can stall startup on a DNS timeout
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as test_socket:
+                test_socket.bind(("127.0.0.1", 0))
             
             return ValidationResult(
                 success=True,
@@ -264,25 +403,19 @@ class StartupValidator:
                 success=False,
                 message="Network connectivity issues detected",
                 details=f"Error: {str(e)}",
-                suggested_actions=[
-                    "Check network configuration",
-                    "Verify localhost resolution",
-                    "Check firewall settings",
-                    "Ensure network stack is functional"
-                ]
+                suggested_actions=_NETWORK_ACTIONS
             )
     
     def validate_permissions(self) -> ValidationResult:
         """Validate file system permissions for application operation."""
-        project_root = Path(__file__).parent.parent
+        project_root = _PROJECT_ROOT
         
         issues = []
         
         # Check if we can write to the application directory (for logs)
         try:
-            test_file = project_root / "test_write_permission.tmp"
-            test_file.write_text("test")
-            test_file.unlink()
+            if not os.access(project_root, os.W_OK):
+                issues.append(f"Cannot write to application directory: {project_root}")
         except Exception as e:
             issues.append(f"Cannot write to application directory: {str(e)}")
         
@@ -290,7 +423,8 @@ class StartupValidator:
         config_dir = project_root / "config"
         if config_dir.exists():
             try:
-                list(config_dir.iterdir())
+                if not os.access(config_dir, os.R_OK | os.X_OK):
+                    issues.append(f"Cannot read configuration directory: {config_dir}")
             except Exception as e:
                 issues.append(f"Cannot read configuration directory: {str(e)}")
         
@@ -299,12 +433,7 @@ class StartupValidator:
                 success=False,
                 message="File system permission issues detected",
                 details="; ".join(issues),
-                suggested_actions=[
-                    "Check file and directory permissions",
-                    "Run application with appropriate user privileges",
-                    "Verify application directory is not read-only",
-                    "Check disk space and file system health"
-                ]
+                suggested_actions=_PERMISSION_ACTIONS
             )
         else:
             return ValidationResult(
@@ -312,10 +441,85 @@ class StartupValidator:
                 message="File system permissions appear adequate"
             )
     
-    def run_all_validations(self) -> Tuple[bool, List[ValidationResult], List[ValidationResult]]:
+    def run_all_validations(self, force: bool = False,
+                            fail_fast: bool = False) -> Tuple[bool, List[ValidationResult], List[ValidationResult]]:
         """
         Run all startup validations.
         
+        Results of a full run are kept on the validator, so repeated calls
+        return them without running the checks again.
+        
+        Args:
+            force: Re-run every check even if earlier or cached results exist
+            fail_fast: Stop at the first critical failure and return partial results
+            
+        Returns:
+            Tuple of (success, critical_failures, warnings)
+        """
+        if self._completed and not force:
+            return len(self.critical_failures) == 0, self.critical_failures, self.warnings
+        
+        return self._run_validations(force, fail_fast=fail_fast)
+    
+    async def run_all_validations_async(self, force: bool = False,
+                                        fail_fast: bool = False) -> Tuple[bool, List[ValidationResult], List[ValidationResult]]:
+        """
+        Run all startup validations without blocking the running event loop.
+        
+        The Tkinter check runs on the event loop's thread because Tk must be
+        used from the thread that created it; all other checks run in a
+        worker thread.
+        
+        Args:
+            force: Re-run every check even if earlier or cached results exist
+            fail_fast: Stop at the first critical failure and return partial results
+            
+        Returns:
+            Tuple of (success, critical_failures, warnings)
+        """
+        import asyncio
+        import functools
+        
+        if self._completed and not force:
+            return len(self.critical_failures) == 0, self.critical_failures, self.warnings
+        
+        overrides = {}
+        cached_results = {} if force else self._load_cached_results(self._get_cache_key())
+        if "Tkinter GUI" not in cached_results:
+            overrides["Tkinter GUI"] = self._capture_validation(self.validate_tkinter_availability)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self._run_validations, force, overrides, fail_fast)
+        )
+    
+    @staticmethod
+    def _capture_validation(validation_func: Callable[[], ValidationResult]) -> Callable[[], ValidationResult]:
+        """Run a check now and return a callable that replays its outcome."""
+        try:
+            result = validation_func()
+        except Exception as e:
+            error = e
+            
+            def replay_error() -> ValidationResult:
+                raise error
+            
+            return replay_error
+        
+        return lambda: result
+    
+    def _run_validations(self, force: bool,
+                         overrides: Optional[Dict[str, Callable[[], ValidationResult]]] = None,
+                         fail_fast: bool = False
+                         ) -> Tuple[bool, List[ValidationResult], List[ValidationResult]]:
+        """
+        Run the validation checks and record their results.
+        
+        Args:
+            force: Ignore recent cached results
+            overrides: Checks replaced by callables that run on the calling thread
+            fail_fast: Stop at the first critical failure
+            
         Returns:
             Tuple of (success, critical_failures, warnings)
         """
@@ -323,88 +527,277 @@ class StartupValidator:
         self.critical_failures.clear()
         self.warnings.clear()
         
-        # Define validation checks
+        cache_key = self._get_cache_key()
+        cached_results = {} if force else self._load_cached_results(cache_key)
+        
+        overrides = dict(overrides or {})
+        for check_name, (result, _) in cached_results.items():
+            overrides[check_name] = lambda result=result: result
+        
+        # Bind the validation checks, substituting overridden ones
         validations = [
-            ("Python Version", self.validate_python_version, True),
-            ("Required Modules", self.validate_required_modules, True),
-            ("Tkinter GUI", self.validate_tkinter_availability, True),
-            ("System Resources", self.validate_system_resources, False),
-            ("Configuration", self.validate_configuration_files, False),
-            ("Network Connectivity", self.validate_network_connectivity, False),
-            ("File Permissions", self.validate_permissions, True),
+            (check_name, overrides.get(check_name) or getattr(self, method_name), is_critical)
+            for check_name, method_name, is_critical in _VALIDATIONS
         ]
+        inline_checks = _MAIN_THREAD_CHECKS.union(overrides)
         
         self.logger.info("Starting application validation checks...")
         
-        for check_name, validation_func, is_critical in validations:
-            try:
-                self.logger.debug(f"Running validation: {check_name}")
-                result = validation_func()
-                self.validation_results.append(result)
-                
-                if not result.success:
-                    if is_critical:
-                        self.critical_failures.append(result)
-                        self.logger.error(f"Critical validation failed: {check_name} - {result.message}")
-                    else:
-                        self.warnings.append(result)
-                        self.logger.warning(f"Validation warning: {check_name} - {result.message}")
-                else:
-                    self.logger.debug(f"Validation passed: {check_name}")
-                    
-            except Exception as e:
-                error_result = ValidationResult(
-                    success=False,
-                    message=f"Validation check '{check_name}' failed with error",
-                    details=str(e),
-                    suggested_actions=["Check application logs for details", "Report this issue"]
-                )
-                self.validation_results.append(error_result)
-                
-                if is_critical:
-                    self.critical_failures.append(error_result)
-                    self.logger.error(f"Critical validation error: {check_name} - {str(e)}")
-                else:
-                    self.warnings.append(error_result)
-                    self.logger.warning(f"Validation error: {check_name} - {str(e)}")
+        try:
+            stopped_early = self._run_checks(validations, inline_checks, fail_fast)
+        finally:
+            self._flush_log_buffer()
+        
+        if len(cached_results) < len(_CACHEABLE_CHECKS):
+            self._save_cached_results(cache_key, [name for name, _, _ in validations], cached_results)
         
         success = len(self.critical_failures) == 0
         
-        self.logger.info(f"Validation complete: {len(self.validation_results)} checks, "
-                        f"{len(self.critical_failures)} critical failures, "
-                        f"{len(self.warnings)} warnings")
+        self.logger.info("Validation complete: %d checks, %d critical failures, %d warnings",
+                         len(self.validation_results), len(self.critical_failures), len(self.warnings))
         
+        self._completed = not stopped_early
         return success, self.critical_failures, self.warnings
     
+    def _run_checks(self, validations: List[Tuple[str, Callable[[], ValidationResult], bool]],
+                    inline_checks: FrozenSet[str], fail_fast: bool) -> bool:
+        """
+        Run the bound validation checks and record their results.
+        
+        Args:
+            validations: Tuples of (check name, check callable, is critical)
+            inline_checks: Names of checks to run on the calling thread
+            fail_fast: Stop at the first critical failure
+            
+        Returns:
+            True if checks were skipped because of fail_fast
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Independent checks run concurrently in worker threads while the Tk
+        # check runs inline; results are collected in declaration order so
+        # logging and self.validation_results stay deterministic
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {
+                index: executor.submit(validation_func)
+                for index, (check_name, validation_func, _) in enumerate(validations)
+                if check_name not in inline_checks
+            }
+            
+            stopped_early = False
+            for index, (check_name, validation_func, is_critical) in enumerate(validations):
+                self._record_validation(check_name, validation_func, is_critical, futures.get(index))
+                
+                if fail_fast and self.critical_failures:
+                    # Drop checks that have not started yet; running ones finish
+                    for future in futures.values():
+                        future.cancel()
+                    stopped_early = index < len(validations) - 1
+                    break
+        
+        return stopped_early
+    
+    def _defer_log(self, level: int, msg: str, *args: object):
+        """Queue a log record to be emitted when the validation run ends."""
+        if self.logger.isEnabledFor(level):
+            self._log_buffer.append((level, msg, args))
+    
+    def _flush_log_buffer(self):
+        """Emit the log records collected during a validation run."""
+        buffered, self._log_buffer = self._log_buffer, []
+        for level, msg, args in buffered:
+            self.logger.log(level, msg, *args)
+    
+    def _get_cache_key(self) -> List[object]:
+        """Build the key identifying the environment cached results belong to."""
+        # Installing or removing packages updates the site directories' mtime
+        site_dirs = []
+        for path_entry in sys.path:
+            if os.path.basename(path_entry) in ("site-packages", "dist-packages"):
+                try:
+                    site_dirs.append([path_entry, os.stat(path_entry).st_mtime])
+                except OSError:
+                    pass
+        
+        return [
+            sys.executable,
+            sys.version,
+            sys.platform,
+            os.environ.get("DISPLAY"),
+            os.environ.get("WAYLAND_DISPLAY"),
+            site_dirs
+        ]
+    
+    def _load_cached_results(self, cache_key: List[object]) -> Dict[str, Tuple[ValidationResult, float]]:
+        """
+        Load recent passing results for the cacheable checks, if any.
+        
+        Args:
+            cache_key: Key identifying the current environment
+            
+        Returns:
+            Dictionary mapping check names to (result, time the result was computed)
+        """
+        try:
+            fd = os.open(_CACHE_PATH, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+            with open(fd, encoding="utf-8") as cache_file:
+                st = os.fstat(cache_file.fileno())
+                if not stat.S_ISREG(st.st_mode):
+                    return {}
+                if _CACHE_UID is not None and st.st_uid != _CACHE_UID:
+                    return {}
+                
+                cached = json.load(cache_file)
+            
+            if cached.get("key") != cache_key:
+                return {}
+            
+            # Each result expires on its own, however often the file is rewritten
+            now = time.time()
+            return {
+                check_name: (ValidationResult.from_dict(entry["result"]), entry["saved_at"])
+                for check_name, entry in cached.get("results", {}).items()
+                if check_name in _CACHEABLE_CHECKS
+                and 0 <= now - entry["saved_at"] <= _CACHE_TTL_SECONDS
+            }
+        except Exception:
+            # Missing, stale or unreadable cache; run the checks
+            return {}
+    
+    def _save_cached_results(self, cache_key: List[object], check_names: List[str],
+                             cached_results: Optional[Dict[str, Tuple[ValidationResult, float]]] = None):
+        """
+        Store passing results of the cacheable checks from the last run.
+        
+        Args:
+            cache_key: Key identifying the current environment
+            check_names: Check names in the order of self.validation_results
+            cached_results: Results replayed from the cache, kept with their original time
+        """
+        cached_results = cached_results or {}
+        results = {
+            check_name: {"saved_at": saved_at, "result": result.to_dict()}
+            for check_name, (result, saved_at) in cached_results.items()
+        }
+        
+        now = time.time()
+        for check_name, result in zip(check_names, self.validation_results):
+            if check_name in _CACHEABLE_CHECKS and check_name not in cached_results and result.success:
+                results[check_name] = {"saved_at": now, "result": result.to_dict()}
+        
+        # Write a private temporary file and rename it over the cache, so a
+        # planted symlink is replaced rather than followed
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=_CACHE_PATH.parent,
+                                             prefix=_CACHE_PATH.stem, suffix=".tmp",
+                                             delete=False) as cache_file:
+                temp_path = cache_file.name
+                json.dump({"key": cache_key, "results": results}, cache_file)
+            os.replace(temp_path, _CACHE_PATH)
+        except Exception as e:
+            self.logger.debug("Could not write validation cache: %s", e)
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+    
+    def _record_validation(self, check_name: str,
+                           validation_func: Callable[[], ValidationResult],
+                           is_critical: bool,
+                           future: Optional['Future'] = None):
+        """
+        Record the outcome of a single validation check.
+        
+        Args:
+            check_name: Display name of the check
+            validation_func: Check to run inline when no future is given
+            is_critical: Whether a failure prevents startup
+            future: Pending result of the check running in a worker thread
+        """
+        try:
+            self._defer_log(logging.DEBUG, "Running validation: %s", check_name)
+            result = future.result() if future is not None else validation_func()
+            self.validation_results.append(result)
+            
+            if not result.success:
+                if is_critical:
+                    self.critical_failures.append(result)
+                    self._defer_log(logging.ERROR, "Critical validation failed: %s - %s", check_name, result.message)
+                else:
+                    self.warnings.append(result)
+                    self._defer_log(logging.WARNING, "Validation warning: %s - %s", check_name, result.message)
+            else:
+                self._defer_log(logging.DEBUG, "Validation passed: %s", check_name)
+                
+        except Exception as e:
+            error_result = ValidationResult(
+                success=False,
+                message=f"Validation check '{check_name}' failed with error",
+                details=str(e),
+                suggested_actions=_CHECK_ERROR_ACTIONS
+            )
+            self.validation_results.append(error_result)
+            
+            if is_critical:
+                self.critical_failures.append(error_result)
+                self._defer_log(logging.ERROR, "Critical validation error: %s - %s", check_name, e)
+            else:
+                self.warnings.append(error_result)
+                self._defer_log(logging.WARNING, "Validation error: %s - %s", check_name, e)
+    
     def get_validation_summary(self) -> str:
         """Get a formatted summary of all validation results."""
+        buffer = io.StringIO()
+        self.write_validation_summary(buffer)
+        return buffer.getvalue()
+    
+    def write_validation_summary(self, stream: TextIO):
+        """
+        Write the formatted summary of all validation results to a stream.
+        
+        Args:
+            stream: Text stream to write the summary to
+        """
         if not self.validation_results:
-            return "No validations have been run."
+            stream.write("No validations have been run.")
+            return
         
-        lines = ["Startup Validation Summary:", "=" * 30]
+        write = stream.write
+        write("Startup Validation Summary:\n" + "=" * 30)
         
         for result in self.validation_results:
-            lines.append(str(result))
+            write("\n")
+            write(str(result))
             if result.details:
-                lines.append(f"  Details: {result.details}")
+                write("\n  Details: ")
+                write(result.details)
             if result.suggested_actions:
-                lines.append("  Suggested actions:")
+                write("\n  Suggested actions:")
                 for action in result.suggested_actions:
-                    lines.append(f"    - {action}")
-            lines.append("")
-        
-        return "\n".join(lines)
+                    write("\n    - ")
+                    write(action)
+            write("\n")
 
 
-def validate_startup() -> Tuple[bool, str]:
+def validate_startup(force: bool = False, fail_fast: bool = True) -> Tuple[bool, str]:
     """
     Convenience function to run all startup validations.
     
+    By default validation stops at the first critical failure and the
+    summary lists only the checks that ran; pass fail_fast=False to run
+    every check regardless.
+    
+    Args:
+        force: Re-run every check even if a recent cached result exists
+        fail_fast: Stop at the first critical failure
+        
     Returns:
         Tuple of (success, summary_message)
     """
     validator = StartupValidator()
-    success, critical_failures, warnings = validator.run_all_validations()
+    success, critical_failures, warnings = validator.run_all_validations(force=force, fail_fast=fail_fast)
     
     summary = validator.get_validation_summary()
     
@@ -3,28 +3,62 @@ Input validation utilities for MCP Dashboard application.
 Provides validation functions for URLs, JSON, and other user inputs.
 """
 import re
+import sys
 import json
+import functools
 import urllib.parse
-from typing import Optional, Dict, Any, List, Tuple, Union
+from typing import Dict, Any, Tuple, Union
 from dataclasses import dataclass
-from enum import Enum
 
 
+# Characters rejected in URLs and endpoint paths, matched in a single scan
+_URL_BAD_CHARS = re.compile(r'[ \t\n\r]')
+_PATH_BAD_CHARS = re.compile(r'[ \t\n\r#?]')
+
+# Whole absolute URL with no whitespace; IPv6 literals are left to urlparse
+_URL_RE = re.compile(
+    r'(?P<scheme>[A-Za-z][A-Za-z0-9+.\-]*)://(?P<host>[^\s/?#\[\]]+)(?P<rest>[/?#]\S*)?\Z'
+)
+_URL_SCHEMES = ('http', 'https')
+
+_VALID_HTTP_METHODS = frozenset(('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'))
+_VALID_HTTP_METHODS_HINT = "Use one of: GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS"
+
+# Slotted dataclasses need Python 3.10+; older versions fall back to __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# First characters of a JSON document (json.loads also accepts NaN/Infinity)
+_JSON_VALUE_START = frozenset('{["-0123456789tfnNI')
+
+# Suggestions keyed on JSONDecodeError.msg (the message without its position)
+_JSON_ERROR_SUGGESTIONS = {
+    "Expecting ',' delimiter": "Check for missing commas between object properties",
+    "Expecting ':' delimiter": "Check for missing colons after property names",
+    "Expecting property name enclosed in double quotes": "Property names must be enclosed in double quotes",
+    "Unterminated string starting at": "Check for missing closing quotes",
+    "Expecting value": "Check for trailing commas or missing values",
+}
+
+# Marks a configuration key that is absent, as opposed to set to None
+_MISSING = object()
+
+# Longest JSON string whose validation result is cached
+_JSON_CACHE_MAX_LENGTH = 4096
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ValidationResult:
     """Result of a validation operation."""
+    is_valid: bool
+    message: str = ""
+    suggestions: Tuple[str, ...] = ()
     
-    def __init__(self, is_valid: bool, message: Optional[str] = None, suggestions: Optional[List[str]] = None):
-        """
-        Initialize validation result.
-        
-        Args:
-            is_valid: Whether the validation passed
-            message: Error message if validation failed
-            suggestions: Suggested corrections
-        """
-        self.is_valid = is_valid
-        self.message = message or ""
-        self.suggestions = suggestions or []
+    def __post_init__(self):
+        """Normalize a missing message and list suggestions."""
+        if self.message is None:
+            object.__setattr__(self, 'message', "")
+        if type(self.suggestions) is not tuple:
+            object.__setattr__(self, 'suggestions', tuple(self.suggestions or ()))
     
     def __bool__(self):
         """Allow using ValidationResult in boolean context."""
@@ -37,6 +71,10 @@ class ValidationResult:
         return f"Invalid: {self.message}"
 
 
+# Shared result for every successful validation
+_VALID_RESULT = ValidationResult(True)
+
+
 class URLValidator:
     """Validator for URLs and endpoints."""
     
@@ -45,6 +83,8 @@ class URLValidator:
         """
         Validate a URL.
         
+        Results are cached, so repeated checks of the same URL are free.
+        
         Args:
             url: URL to validate
             require_scheme: Whether to require http/https scheme
@@ -52,10 +92,20 @@ class URLValidator:
         Returns:
             ValidationResult with validation outcome
         """
-        if not url or not url.strip():
+        return _validate_url_cached(url, require_scheme)
+    
+    @staticmethod
+    def _validate_url(url: str, require_scheme: bool) -> ValidationResult:
+        """Validate a URL without consulting the result cache."""
+        url = url.strip() if url else ""
+        if not url:
             return ValidationResult(False, "URL cannot be empty")
         
-        url = url.strip()
+        # A well-formed http(s) URL is accepted after one regex match; only
+        # other input goes through urlparse for a specific error message
+        match = _URL_RE.match(url)
+        if match and match.group('scheme').lower() in _URL_SCHEMES and match.group('host').isascii():
+            return _VALID_RESULT
         
         try:
             parsed = urllib.parse.urlparse(url)
@@ -69,7 +119,7 @@ class URLValidator:
                         ["Add http:// or https:// to the beginning"]
                     )
                 
-                if parsed.scheme not in ['http', 'https']:
+                if parsed.scheme not in _URL_SCHEMES:
                     return ValidationResult(
                         False,
                         "URL scheme must be http or https",
@@ -84,22 +134,22 @@ class URLValidator:
                     ["Add a valid domain name (e.g., localhost, example.com)"]
                 )
             
-            # Check for valid characters
-            if any(char in url for char in [' ', '\t', '\n', '\r']):
-                return ValidationResult(
-                    False,
-                    "URL cannot contain whitespace characters",
-                    ["Remove spaces and line breaks from the URL"]
-                )
-            
-            return ValidationResult(True)
-            
         except Exception as e:
             return ValidationResult(
                 False,
                 f"Invalid URL format: {str(e)}",
                 ["Check the URL format and try again"]
             )
+        
+        # Check for valid characters
+        if _URL_BAD_CHARS.search(url):
+            return ValidationResult(
+                False,
+                "URL cannot contain whitespace characters",
+                ["Remove spaces and line breaks from the URL"]
+            )
+        
+        return _VALID_RESULT
     
     @staticmethod
     def validate_endpoint_path(path: str) -> ValidationResult:
@@ -126,14 +176,13 @@ class URLValidator:
             )
         
         # Check for invalid characters
-        invalid_chars = [' ', '\t', '\n', '\r', '#', '?']
-        for char in invalid_chars:
-            if char in path:
-                return ValidationResult(
-                    False,
-                    f"Endpoint path cannot contain '{char}' character",
-                    ["Remove invalid characters from the path"]
-                )
+        invalid_char = _PATH_BAD_CHARS.search(path)
+        if invalid_char:
+            return ValidationResult(
+                False,
+                f"Endpoint path cannot contain '{invalid_char.group(0)}' character",
+                ["Remove invalid characters from the path"]
+            )
         
         # Check for double slashes
         if '//' in path:
@@ -143,7 +192,7 @@ class URLValidator:
                 ["Remove extra slashes from the path"]
             )
         
-        return ValidationResult(True)
+        return _VALID_RESULT
     
     @staticmethod
     def normalize_url(url: str) -> str:
@@ -164,14 +213,14 @@ class URLValidator:
         # Add scheme if missing
         if not url.startswith(('http://', 'https://')):
             # Default to http for localhost, https for others
-            if url.startswith('localhost') or url.startswith('127.0.0.1'):
+            if url.startswith(('localhost', '127.0.0.1')):
                 url = f"http://{url}"
             else:
                 url = f"https://{url}"
         
-        # Remove trailing slash
+        # Remove a single trailing slash
         if url.endswith('/') and len(url) > 1:
-            url = url.rstrip('/')
+            url = url[:-1]
         
         return url
 
@@ -184,51 +233,66 @@ class JSONValidator:
         """
         Validate JSON string.
         
+        Results for short strings are cached; large payloads are always
+        parsed so they are not kept alive by the cache.
+        
         Args:
             json_str: JSON string to validate
             
         Returns:
             ValidationResult with validation outcome
         """
-        if not json_str or not json_str.strip():
-            return ValidationResult(True)  # Empty JSON is valid (will be ignored)
+        if json_str and len(json_str) > _JSON_CACHE_MAX_LENGTH:
+            return JSONValidator._validate_json(json_str)
+        return _validate_json_cached(json_str)
+    
+    @staticmethod
+    def _validate_json(json_str: str) -> ValidationResult:
+        """Validate a JSON string without consulting the result cache."""
+        return JSONValidator.parse(json_str)[0]
+    
+    @staticmethod
+    def parse(json_str: str) -> Tuple[ValidationResult, Any]:
+        """
+        Validate and parse a JSON string in one step.
         
-        json_str = json_str.strip()
+        Args:
+            json_str: JSON string to parse
+            
+        Returns:
+            Tuple of (ValidationResult, parsed value or None if empty or invalid)
+        """
+        json_str = json_str.strip() if json_str else ""
+        if not json_str:
+            return _VALID_RESULT, None  # Empty JSON is valid (will be ignored)
+        
+        # Anything that cannot start a JSON value is rejected without parsing
+        if json_str[0] not in _JSON_VALUE_START:
+            return ValidationResult(
+                False,
+                "Invalid JSON: must start with an object, array, or literal",
+                ["Check JSON syntax and formatting"]
+            ), None
         
         try:
-            json.loads(json_str)
-            return ValidationResult(True)
+            return _VALID_RESULT, json.loads(json_str)
             
         except json.JSONDecodeError as e:
             # Try to provide helpful error messages
-            error_msg = str(e)
-            suggestions = []
-            
-            if "Expecting ',' delimiter" in error_msg:
-                suggestions.append("Check for missing commas between object properties")
-            elif "Expecting ':' delimiter" in error_msg:
-                suggestions.append("Check for missing colons after property names")
-            elif "Expecting property name" in error_msg:
-                suggestions.append("Property names must be enclosed in double quotes")
-            elif "Unterminated string" in error_msg:
-                suggestions.append("Check for missing closing quotes")
-            elif "Expecting value" in error_msg:
-                suggestions.append("Check for trailing commas or missing values")
-            else:
-                suggestions.append("Check JSON syntax and formatting")
+            suggestion = _JSON_ERROR_SUGGESTIONS.get(e.msg, "Check JSON syntax and formatting")
             
             return ValidationResult(
                 False,
-                f"Invalid JSON: {error_msg}",
-                suggestions
-            )
+                f"Invalid JSON: {e}",
+                [suggestion]
+            ), None
         
         except Exception as e:
             return ValidationResult(
                 False,
                 f"JSON validation error: {str(e)}",
                 ["Check JSON format and try again"]
-            )
+            ), None
     
     @staticmethod
     def format_json(json_str: str, indent: int = 2) -> str:
@@ -242,17 +306,35 @@ class JSONValidator:
         Returns:
             Formatted JSON string
         """
+        if not json_str or not json_str.strip():
+            return json_str
+        
+        result, parsed = JSONValidator.parse(json_str)
+        if not result:
+            return json_str  # Return original if the JSON is invalid
+        
         try:
-            if not json_str or not json_str.strip():
-                return json_str
-            
-            parsed = json.loads(json_str)
             return json.dumps(parsed, indent=indent, ensure_ascii=False)
             
         except Exception:
             return json_str  # Return original if formatting fails
 
 
+# Validation results for recently seen inputs; clear with cache_clear()
+_validate_url_cached = functools.lru_cache(maxsize=512)(URLValidator._validate_url)
+_validate_json_cached = functools.lru_cache(maxsize=512)(JSONValidator._validate_json)
+
+
+@functools.lru_cache(maxsize=64)
+def _required_field_error(field_name: str) -> ValidationResult:
+    """Build (once per field name) the result for an empty required field."""
+    return ValidationResult(
+        False,
+        f"{field_name} is required",
+        (f"Please enter a value for {field_name}",)
+    )
+
+
 class InputValidator:
     """General input validator."""
     
@@ -269,13 +351,9 @@ class InputValidator:
             ValidationResult with validation outcome
         """
         if not value or not value.strip():
-            return ValidationResult(
-                False,
-                f"{field_name} is required",
-                [f"Please enter a value for {field_name}"]
-            )
+            return _required_field_error(field_name)
         
-        return ValidationResult(True)
+        return _VALID_RESULT
     
     @staticmethod
     def validate_http_method(method: str) -> ValidationResult:
@@ -292,16 +370,15 @@ class InputValidator:
             return ValidationResult(False, "HTTP method is required")
         
         method = method.strip().upper()
-        valid_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']
         
-        if method not in valid_methods:
+        if method not in _VALID_HTTP_METHODS:
             return ValidationResult(
                 False,
                 f"Invalid HTTP method: {method}",
-                [f"Use one of: {', '.join(valid_methods)}"]
+                [_VALID_HTTP_METHODS_HINT]
             )
         
-        return ValidationResult(True)
+        return _VALID_RESULT
     
     @staticmethod
     def validate_timeout(timeout_str: str) -> ValidationResult:
@@ -314,34 +391,44 @@ class InputValidator:
         Returns:
             ValidationResult with validation outcome
         """
-        if not timeout_str or not timeout_str.strip():
+        timeout_str = timeout_str.strip() if timeout_str else ""
+        if not timeout_str:
             return ValidationResult(False, "Timeout value is required")
         
+        # Plain digit strings always convert; only signed or unusual input
+        # needs the try/except around int()
+        if timeout_str.isdecimal():
+            return InputValidator._validate_timeout_int(int(timeout_str))
+        
         try:
-            timeout = int(timeout_str.strip())
-            
-            if timeout <= 0:
-                return ValidationResult(
-                    False,
-                    "Timeout must be greater than 0",
-                    ["Enter a positive number"]
-                )
-            
-            if timeout > 300000:  # 5 minutes
-                return ValidationResult(
-                    False,
-                    "Timeout cannot exceed 300000ms (5 minutes)",
-                    ["Use a smaller timeout value"]
-                )
-            
-            return ValidationResult(True)
-            
+            timeout = int(timeout_str)
         except ValueError:
             return ValidationResult(
                 False,
                 "Timeout must be a valid number",
                 ["Enter a number in milliseconds (e.g., 5000 for 5 seconds)"]
             )
+        
+        return InputValidator._validate_timeout_int(timeout)
+    
+    @staticmethod
+    def _validate_timeout_int(timeout: int) -> ValidationResult:
+        """Validate a timeout that is already an integer number of milliseconds."""
+        if timeout <= 0:
+            return ValidationResult(
+                False,
+                "Timeout must be greater than 0",
+                ["Enter a positive number"]
+            )
+        
+        if timeout > 300000:  # 5 minutes
+            return ValidationResult(
+                False,
+                "Timeout cannot exceed 300000ms (5 minutes)",
+                ["Use a smaller timeout value"]
+            )
+        
+        return _VALID_RESULT
     
     @staticmethod
     def validate_port(port_str: str) -> ValidationResult:
@@ -354,27 +441,35 @@ class InputValidator:
         Returns:
             ValidationResult with validation outcome
         """
-        if not port_str or not port_str.strip():
+        port_str = port_str.strip() if port_str else ""
+        if not port_str:
             return ValidationResult(False, "Port number is required")
         
+        if port_str.isdecimal():
+            return InputValidator._validate_port_int(int(port_str))
+        
         try:
-            port = int(port_str.strip())
-            
-            if port < 1 or port > 65535:
-                return ValidationResult(
-                    False,
-                    "Port must be between 1 and 65535",
-                    ["Use a valid port number (e.g., 8080, 3000, 443)"]
-                )
-            
-            return ValidationResult(True)
-            
+            port = int(port_str)
         except ValueError:
             return ValidationResult(
                 False,
                 "Port must be a valid number",
                 ["Enter a number between 1 and 65535"]
             )
+        
+        return InputValidator._validate_port_int(port)
+    
+    @staticmethod
+    def _validate_port_int(port: int) -> ValidationResult:
+        """Validate a port number that is already an integer."""
+        if port < 1 or port > 65535:
+            return ValidationResult(
+                False,
+                "Port must be between 1 and 65535",
+                ["Use a valid port number (e.g., 8080, 3000, 443)"]
+            )
+        
+        return _VALID_RESULT
 
 
 class ConfigValidator:
@@ -391,14 +486,11 @@ class ConfigValidator:
         Returns:
             ValidationResult with validation outcome
         """
-        required_fields = ['name', 'endpoint']
-        missing_fields = []
+        name = config.get('name')
+        endpoint = config.get('endpoint')
         
-        for field in required_fields:
-            if field not in config or not config[field]:
-                missing_fields.append(field)
-        
-        if missing_fields:
+        if not (name and endpoint):
+            missing_fields = [field for field, value in (('name', name), ('endpoint', endpoint)) if not value]
             return ValidationResult(
                 False,
                 f"Missing required fields: {', '.join(missing_fields)}",
@@ -406,7 +498,7 @@ class ConfigValidator:
             )
         
         # Validate endpoint URL
-        endpoint_result = URLValidator.validate_url(config['endpoint'])
+        endpoint_result = URLValidator.validate_url(endpoint)
         if not endpoint_result:
             return ValidationResult(
                 False,
@@ -414,9 +506,13 @@ class ConfigValidator:
                 endpoint_result.suggestions
             )
         
-        # Validate timeout if present
-        if 'timeout' in config:
-            timeout_result = InputValidator.validate_timeout(str(config['timeout']))
+        # Validate timeout if present (an explicit None is still checked)
+        timeout = config.get('timeout', _MISSING)
+        if timeout is not _MISSING:
+            if type(timeout) is int:
+                timeout_result = InputValidator._validate_timeout_int(timeout)
+            else:
+                timeout_result = InputValidator.validate_timeout(str(timeout))
             if not timeout_result:
                 return ValidationResult(
                     False,
@@ -424,7 +520,7 @@ class ConfigValidator:
                     timeout_result.suggestions
                 )
         
-        return ValidationResult(True)
+        return _VALID_RESULT
 
 
 def validate_all(*validators: ValidationResult) -> ValidationResult:
@@ -437,21 +533,21 @@ def validate_all(*validators: ValidationResult) -> ValidationResult:
     Returns:
         Combined ValidationResult (fails if any validator fails)
     """
-    failed_validators = [v for v in validators if not v.is_valid]
-    
-    if not failed_validators:
-        return ValidationResult(True)
-    
-    # Combine error messages
-    messages = [v.message for v in failed_validators if v.message]
-    combined_message = "; ".join(messages)
-    
-    # Combine suggestions
+    # Collect messages and suggestions of the failed results in one pass
+    is_valid = True
+    messages = []
     all_suggestions = []
-    for v in failed_validators:
-        all_suggestions.extend(v.suggestions)
+    for v in validators:
+        if not v.is_valid:
+            is_valid = False
+            if v.message:
+                messages.append(v.message)
+            all_suggestions.extend(v.suggestions)
+    
+    if is_valid:
+        return _VALID_RESULT
     
-    return ValidationResult(False, combined_message, all_suggestions)
+    return ValidationResult(False, "; ".join(messages), all_suggestions)
 
 
 # Convenience functions for backward compatibility and simpler testing
@@ -467,6 +563,9 @@ def validate_port(port: Union[str, int]) -> bool:
     """Simple port validation function."""
     if port is None:
         return False
+    # Integers skip the round trip through str (bools still take the string path)
+    if type(port) is int:
+        return InputValidator._validate_port_int(port).is_valid
     result = InputValidator.validate_port(str(port))
     return result.is_valid
 
@@ -475,6 +574,8 @@ def validate_timeout(timeout: Union[str, int]) -> bool:
     """Simple timeout validation function."""
     if timeout is None:
         return False
+    if type(timeout) is int:
+        return InputValidator._validate_timeout_int(timeout).is_valid
     result = InputValidator.validate_timeout(str(timeout))
     return result.is_valid
 